@@ -0,0 +1,52 @@
+"""
+Micro-benchmark: per-request JWT verification cost with and without the
+verified-token cache.
+
+Usage (from backend/):
+    python bench_verify_token.py [iterations]
+"""
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "src"))
+
+from jose import jwt  # noqa: E402
+from config.jwt_config import (  # noqa: E402
+    JWT_ALGORITHM,
+    JWT_SECRET,
+    create_jwt_token,
+    token_cache,
+    verify_token,
+)
+
+
+def _per_call_us(func, token: str, iterations: int) -> float:
+    started = time.perf_counter()
+    for _ in range(iterations):
+        func(token)
+    return (time.perf_counter() - started) / iterations * 1e6
+
+
+def main(iterations: int) -> None:
+    token = create_jwt_token({
+        "_id": "64b7f0c2a1b2c3d4e5f60718",
+        "email": "bench@example.com",
+        "name": "Bench User",
+        "role": "user",
+    })
+
+    uncached = _per_call_us(
+        lambda t: jwt.decode(t, JWT_SECRET, algorithms=[JWT_ALGORITHM]), token, iterations
+    )
+    token_cache.clear()
+    cached = _per_call_us(verify_token, token, iterations)
+
+    print(f"iterations:         {iterations}")
+    print(f"jose decode:        {uncached:8.2f} us/request")
+    print(f"verify_token cache: {cached:8.2f} us/request ({uncached / cached:.1f}x)")
+    print(f"cache stats:        {token_cache.stats()}")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 20000)
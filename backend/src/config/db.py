@@ -1,4 +1,4 @@
-from pymongo import MongoClient
+from motor.motor_asyncio import AsyncIOMotorClient, AsyncIOMotorDatabase
 import os
 from dotenv import load_dotenv
 
@@ -8,7 +8,12 @@ try:
 except Exception:  # pragma: no cover
     dns = None  # dnspython is provided by pymongo[srv], but keep this safe
 
+import asyncio
 import logging
+import time
+from typing import Optional
+from pymongo import ReadPreference
+from pymongo.read_preferences import read_pref_mode_from_name, make_read_preference
 from pymongo.errors import ServerSelectionTimeoutError
 
 load_dotenv()
@@ -55,47 +60,193 @@ def _configure_dns_resolver_if_needed() -> None:
     _DNS_CONFIGURED = True
 
 
-def _build_client(uri: str) -> MongoClient:
-    server_selection_timeout_ms = int(os.getenv("MONGO_SERVER_SELECTION_TIMEOUT_MS", "20000"))
-    connect_timeout_ms = int(os.getenv("MONGO_CONNECT_TIMEOUT_MS", "20000"))
-    return MongoClient(
+def _int_env(name: str, default: int) -> int:
+    try:
+        return int(os.getenv(name, str(default)))
+    except ValueError:
+        return default
+
+
+def _build_client(uri: str) -> AsyncIOMotorClient:
+    """
+    Build a pooled async (Motor) client.
+
+    Env vars:
+      - MONGO_SERVER_SELECTION_TIMEOUT_MS / MONGO_CONNECT_TIMEOUT_MS (default 20000)
+      - MONGO_MAX_POOL_SIZE: max connections per server (default 100)
+      - MONGO_MIN_POOL_SIZE: connections kept open per server (default 0)
+      - MONGO_MAX_IDLE_TIME_MS: close pooled connections idle this long (default 300000)
+      - MONGO_WAIT_QUEUE_TIMEOUT_MS: max wait for a free pooled connection (default 10000)
+    """
+    return AsyncIOMotorClient(
         uri,
-        serverSelectionTimeoutMS=server_selection_timeout_ms,
-        connectTimeoutMS=connect_timeout_ms,
+        serverSelectionTimeoutMS=_int_env("MONGO_SERVER_SELECTION_TIMEOUT_MS", 20000),
+        connectTimeoutMS=_int_env("MONGO_CONNECT_TIMEOUT_MS", 20000),
+        maxPoolSize=_int_env("MONGO_MAX_POOL_SIZE", 100),
+        minPoolSize=_int_env("MONGO_MIN_POOL_SIZE", 0),
+        maxIdleTimeMS=_int_env("MONGO_MAX_IDLE_TIME_MS", 300000),
+        waitQueueTimeoutMS=_int_env("MONGO_WAIT_QUEUE_TIMEOUT_MS", 10000),
     )
 
 
-def get_db_connection():
+# Process-wide client and database handles, created once by init_db()
+_client: Optional[AsyncIOMotorClient] = None
+_db: Optional[AsyncIOMotorDatabase] = None
+_read_db: Optional[AsyncIOMotorDatabase] = None
+
+
+def _read_preference():
+    """
+    Read preference for read-only endpoints.
+
+    Env vars:
+      - MONGO_READ_PREFERENCE: primary | primaryPreferred | secondary |
+        secondaryPreferred | nearest (default secondaryPreferred)
+      - MONGO_MAX_STALENESS_SECONDS: max replication lag tolerated on a
+        secondary, -1 for no limit (default 90, the server minimum)
+    """
+    name = os.getenv("MONGO_READ_PREFERENCE", "secondaryPreferred").strip()
+    try:
+        mode = read_pref_mode_from_name(name)
+    except ValueError:
+        logging.warning("Unknown MONGO_READ_PREFERENCE %r; using primary", name)
+        return ReadPreference.PRIMARY
+    if mode == ReadPreference.PRIMARY.mode:
+        # Primary does not accept a staleness bound
+        return ReadPreference.PRIMARY
+    return make_read_preference(mode, None, max_staleness=_int_env("MONGO_MAX_STALENESS_SECONDS", 90))
+
+
+# Timings of the last init_db() call, exposed on /health
+_warmup_stats: dict = {}
+
+
+async def _resolve_seed_list(db_uri: str) -> str:
+    """
+    Resolve a mongodb+srv:// URI once through the SRV cache (MONGO_SRV_CACHE,
+    default on) so the driver starts from a plain seed list. Falls back to the
+    original URI, letting the driver do its own SRV lookup, if resolution fails.
+    """
+    if os.getenv("MONGO_SRV_CACHE", "true").lower() not in ("1", "true", "yes"):
+        return db_uri
+    from config.srv_cache import resolve_srv_uri
+
+    started = time.perf_counter()
+    try:
+        uri, source = await asyncio.to_thread(resolve_srv_uri, db_uri)
+    except Exception as e:
+        logging.warning("SRV pre-resolution failed, letting the driver resolve: %s", e)
+        return db_uri
+    _warmup_stats["srv_source"] = source
+    _warmup_stats["srv_ms"] = round((time.perf_counter() - started) * 1000, 1)
+    return uri
+
+
+async def _warm_pool(client: AsyncIOMotorClient) -> None:
+    """
+    Check out MONGO_WARMUP_CONNECTIONS connections concurrently so the first
+    requests do not pay TCP/TLS/auth handshakes.
+    """
+    count = _int_env("MONGO_WARMUP_CONNECTIONS", 4)
+    if count <= 0:
+        return
+    started = time.perf_counter()
+    await asyncio.gather(*(client.admin.command("ping") for _ in range(count)))
+    _warmup_stats["pool_warmup_ms"] = round((time.perf_counter() - started) * 1000, 1)
+    _warmup_stats["warm_connections"] = count
+
+
+async def _connect() -> AsyncIOMotorClient:
+    """Connect to DB_URI, failing over to DB_FALLBACK_URI if server selection fails"""
     db_uri = os.getenv("DB_URI")
     if not db_uri:
         raise ValueError("DB_URI environment variable not set")
 
-    # If using SRV scheme, allow optional DNS override
+    # If using SRV scheme, allow optional DNS override and resolve the seed list once
     if db_uri.startswith("mongodb+srv://"):
         _configure_dns_resolver_if_needed()
-
-    db_name = os.getenv("DB_NAME", "file-system")
+        db_uri = await _resolve_seed_list(db_uri)
 
     # Try primary URI first
     client = _build_client(db_uri)
     try:
         # Force early server selection (DNS+connect) to fail fast if needed
-        client.admin.command("ping")
-        return client[db_name]
+        await client.admin.command("ping")
+        return client
     except ServerSelectionTimeoutError as e:
+        client.close()
         logging.warning("Mongo primary URI server selection failed: %s", e)
         fallback_uri = os.getenv("DB_FALLBACK_URI", "").strip()
         if fallback_uri:
             logging.warning("Attempting fallback Mongo URI (SRV-less/direct hosts)...")
             fb_client = _build_client(fallback_uri)
             try:
-                fb_client.admin.command("ping")
-                return fb_client[db_name]
+                await fb_client.admin.command("ping")
+                return fb_client
             except ServerSelectionTimeoutError as e2:
+                fb_client.close()
                 logging.error("Fallback Mongo URI also failed: %s", e2)
                 raise
         # No fallback configured; re-raise
         raise
 
+
+async def init_db() -> AsyncIOMotorDatabase:
+    """
+    Create the application-lifetime client (called once from the app lifespan).
+    Safe to call repeatedly; later calls return the existing handle.
+    """
+    global _client, _db, _read_db
+    if _db is None:
+        started = time.perf_counter()
+        client = await _connect()
+        _warmup_stats["connect_ms"] = round((time.perf_counter() - started) * 1000, 1)
+        await _warm_pool(client)
+        _warmup_stats["total_ms"] = round((time.perf_counter() - started) * 1000, 1)
+        logging.info("MongoDB ready in %.1f ms (%s)", _warmup_stats["total_ms"], _warmup_stats)
+        _client = client
+        _db = _client[os.getenv("DB_NAME", "file-system")]
+        _read_db = _db.with_options(read_preference=_read_preference())
+    return _db
+
+
+def close_db() -> None:
+    """Close the shared client and its connection pool (called on app shutdown)"""
+    global _client, _db, _read_db
+    if _client is not None:
+        _client.close()
+    _client = None
+    _db = None
+    _read_db = None
+
+
+def get_warmup_stats() -> dict:
+    """Timings (ms) of DB startup: SRV resolution, connect, pool warm-up, total"""
+    return dict(_warmup_stats)
+
+
+def get_db() -> AsyncIOMotorDatabase:
+    """FastAPI dependency returning the shared database handle"""
+    if _db is None:
+        raise RuntimeError("Database not initialized; init_db() must run in the app lifespan")
+    return _db
+
+
+def get_read_db() -> AsyncIOMotorDatabase:
+    """
+    Database handle for read-only endpoints, routed per MONGO_READ_PREFERENCE.
+    Paths that must read their own writes (permission checks before an update,
+    responses of update/approve) use get_db() and stay on the primary.
+    """
+    if _read_db is None:
+        raise RuntimeError("Database not initialized; init_db() must run in the app lifespan")
+    return _read_db
+
+
+def get_db_connection() -> AsyncIOMotorDatabase:
+    """Return the shared database handle (backward compatibility)"""
+    return get_db()
+
 # Example usage:
-# db = get_db_connection()
\ No newline at end of file
+# db = get_db()
+# user = await db.users.find_one({"email": email})
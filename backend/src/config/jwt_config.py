@@ -1,8 +1,11 @@
 import os
+import hashlib
+import time
 from datetime import datetime, timedelta
 from typing import Optional
 from jose import JWTError, jwt
 from dotenv import load_dotenv
+from utils_dir.cache import TTLCache
 
 load_dotenv()
 
@@ -10,6 +13,10 @@ JWT_SECRET = os.getenv("JWT_SECRET", "your-super-secret-jwt-key-change-this-in-p
 JWT_ALGORITHM = "HS256"
 JWT_EXPIRATION_HOURS = 24
 
+# When enabled, get_current_user authorizes from the signed role/token_version
+# claims instead of loading the user document on every request
+JWT_STATELESS_CLAIMS = os.getenv("JWT_STATELESS_CLAIMS", "false").lower() in ("1", "true", "yes")
+
 def create_access_token(data: dict, expires_delta: Optional[timedelta] = None):
     """Create a JWT access token"""
     to_encode = data.copy()
@@ -22,14 +29,44 @@ def create_access_token(data: dict, expires_delta: Optional[timedelta] = None):
     encoded_jwt = jwt.encode(to_encode, JWT_SECRET, algorithm=JWT_ALGORITHM)
     return encoded_jwt
 
+# Tokens for GET /events/stream, which browsers' EventSource can only
+# authenticate through the URL: short-lived, scoped, and without the user_id
+# claim, so get_current_user rejects them as API credentials
+STREAM_TOKEN_SCOPE = "event-stream"
+STREAM_TOKEN_TTL_SECONDS = int(os.getenv("STREAM_TOKEN_TTL_SECONDS", "60"))
+
+def create_stream_token(user_id: str) -> str:
+    return create_access_token(
+        {"sub": user_id, "scope": STREAM_TOKEN_SCOPE},
+        timedelta(seconds=STREAM_TOKEN_TTL_SECONDS)
+    )
+
+# Decoded payloads of already-verified tokens, keyed by SHA-256 of the token.
+# Entries never outlive the token's own exp claim.
+token_cache = TTLCache(
+    maxsize=int(os.getenv("JWT_CACHE_MAX_SIZE", "10000")),
+    ttl=float(os.getenv("JWT_CACHE_MAX_TTL_SECONDS", "300")),
+)
+
 def verify_token(token: str):
     """Verify and decode a JWT token"""
+    key = hashlib.sha256(token.encode()).digest()
+    cached = token_cache.get(key)
+    if cached is not None:
+        if cached.get("exp", 0) > time.time():
+            return dict(cached)
+        token_cache.invalidate(key)
+
     try:
         payload = jwt.decode(token, JWT_SECRET, algorithms=[JWT_ALGORITHM])
-        return payload
     except JWTError:
         return None
 
+    remaining = payload.get("exp", 0) - time.time()
+    if remaining > 0:
+        token_cache.set(key, payload, ttl=min(remaining, token_cache.ttl))
+    return dict(payload)
+
 def create_jwt_token(user_data):
     """Create a JWT token for the user (backward compatibility)"""
     payload = {
@@ -37,6 +74,9 @@ def create_jwt_token(user_data):
         "email": user_data["email"],
         "name": user_data["name"],
         "picture": user_data.get("picture", ""),
+        "role": user_data.get("role", "user"),
+        "tv": user_data.get("token_version", 0),  # Bumped to revoke issued tokens
+        "created_at": str(user_data["created_at"]) if user_data.get("created_at") else None,
         "sub": str(user_data["_id"])  # Standard JWT claim
     }
     return create_access_token(payload)
@@ -0,0 +1,135 @@
+import json
+import logging
+import os
+import time
+from typing import Optional, Tuple
+from urllib.parse import parse_qsl, urlencode, urlsplit
+
+try:
+    import dns.resolver  # type: ignore
+except Exception:  # pragma: no cover
+    dns = None
+
+
+def _cache_file() -> str:
+    return os.getenv("MONGO_SRV_CACHE_FILE", ".mongo_srv_cache.json").strip()
+
+
+def _min_ttl() -> int:
+    try:
+        return int(os.getenv("MONGO_SRV_CACHE_MIN_TTL", "60"))
+    except ValueError:
+        return 60
+
+
+# In-memory copy of the persisted cache: {srv_host: {"hosts": [...], "options": {...}, "expires_at": ts}}
+_cache: dict = {}
+_loaded = False
+
+
+def _load_cache_file() -> None:
+    global _loaded
+    if _loaded:
+        return
+    _loaded = True
+    path = _cache_file()
+    if not path or not os.path.exists(path):
+        return
+    try:
+        with open(path, "r") as f:
+            _cache.update(json.load(f))
+    except (OSError, ValueError) as e:
+        logging.warning("Ignoring unreadable SRV cache file %s: %s", path, e)
+
+
+def _save_cache_file() -> None:
+    path = _cache_file()
+    if not path:
+        return
+    try:
+        tmp = f"{path}.tmp"
+        with open(tmp, "w") as f:
+            json.dump(_cache, f)
+        os.replace(tmp, path)
+    except OSError as e:
+        logging.warning("Could not persist SRV cache to %s: %s", path, e)
+
+
+def _resolve(srv_host: str) -> dict:
+    """Resolve the SRV seed list and TXT options for a mongodb+srv host"""
+    if not dns or not hasattr(dns, "resolver"):
+        raise RuntimeError("dnspython is not installed")
+
+    srv_answer = dns.resolver.resolve(f"_mongodb._tcp.{srv_host}", "SRV")
+    ttl = srv_answer.rrset.ttl
+    parent = srv_host.split(".", 1)[1] if srv_host.count(".") >= 2 else srv_host
+    hosts = []
+    for record in srv_answer:
+        target = str(record.target).rstrip(".")
+        # Same guard as the driver: seeds must live under the SRV host's parent domain
+        if not target.endswith(f".{parent}"):
+            raise ValueError(f"SRV record {target} is not within {parent}")
+        hosts.append(f"{target}:{record.port}")
+
+    options = {}
+    try:
+        txt_answer = dns.resolver.resolve(srv_host, "TXT")
+        ttl = min(ttl, txt_answer.rrset.ttl)
+        for record in txt_answer:
+            txt = b"".join(record.strings).decode()
+            options.update(dict(parse_qsl(txt)))
+    except (dns.resolver.NoAnswer, dns.resolver.NXDOMAIN):
+        pass
+
+    return {
+        "hosts": sorted(hosts),
+        "options": options,
+        "expires_at": time.time() + max(ttl, _min_ttl()),
+    }
+
+
+def _build_seedlist_uri(parts, entry: dict) -> str:
+    userinfo = parts.netloc.rsplit("@", 1)[0] + "@" if "@" in parts.netloc else ""
+    # TXT options first, explicit URI options override; SRV implies TLS
+    options = {"tls": "true", **entry["options"], **dict(parse_qsl(parts.query))}
+    # SRV-only options are rejected on a plain mongodb:// URI
+    options.pop("srvServiceName", None)
+    options.pop("srvMaxHosts", None)
+    return f"mongodb://{userinfo}{','.join(entry['hosts'])}{parts.path or '/'}?{urlencode(options)}"
+
+
+def resolve_srv_uri(uri: str) -> Tuple[str, Optional[str]]:
+    """
+    Turn a mongodb+srv:// URI into an equivalent mongodb:// seed-list URI,
+    using the cached SRV/TXT answer while its TTL is valid.
+
+    Only host lists and TXT options are persisted to MONGO_SRV_CACHE_FILE;
+    credentials stay in the URI. If DNS fails and an expired entry exists it is
+    used anyway (the driver rediscovers the topology from any reachable seed).
+
+    Returns (uri, source) where source is "memory", "file", "dns", "stale"
+    or None if the URI was not an SRV URI.
+    """
+    if not uri.startswith("mongodb+srv://"):
+        return uri, None
+
+    parts = urlsplit(uri)
+    srv_host = parts.hostname
+    from_file = not _loaded
+    _load_cache_file()
+
+    entry = _cache.get(srv_host)
+    if entry and entry["expires_at"] > time.time():
+        return _build_seedlist_uri(parts, entry), "file" if from_file else "memory"
+
+    try:
+        fresh = _resolve(srv_host)
+    except Exception as e:
+        if entry:
+            logging.warning("SRV lookup for %s failed (%s); using stale cached seed list", srv_host, e)
+            return _build_seedlist_uri(parts, entry), "stale"
+        raise
+
+    _cache[srv_host] = fresh
+    _save_cache_file()
+    return _build_seedlist_uri(parts, fresh), "dns"
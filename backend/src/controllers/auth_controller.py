@@ -1,20 +1,31 @@
-from fastapi import HTTPException, status, Request, Response
+from fastapi import BackgroundTasks, HTTPException, status, Request, Response
 from fastapi.responses import RedirectResponse
 from datetime import datetime
 from bson import ObjectId
 import secrets
 import os
-from config.db import get_db_connection
+from repositories import UserRepository
+from services.user_cache import invalidate_user
 from config.jwt_config import create_jwt_token, verify_jwt_token
 from services.google_oauth import GoogleOAuthService
 from models.user import User
-from passlib.hash import bcrypt
+from services.password_hasher import password_hasher, HasherSaturatedError
 from urllib.parse import urlencode
+from typing import Optional
 
 class AuthController:
-    def __init__(self):
-        self.db = get_db_connection()
-        self.google_oauth = GoogleOAuthService()
+    def __init__(self, users: UserRepository, google_oauth: Optional[GoogleOAuthService]):
+        # Built once by the service container and shared across requests
+        self.users = users
+        self.google_oauth = google_oauth
+
+    def _require_google_oauth(self) -> GoogleOAuthService:
+        if self.google_oauth is None:
+            raise HTTPException(
+                status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                detail="Google OAuth is not configured"
+            )
+        return self.google_oauth
     
     async def google_login_url(self, request: Request, frontend_redirect_uri: str = None):
         """Generate Google OAuth2 login URL and store frontend redirect URI"""
@@ -24,7 +35,7 @@ class AuthController:
         if frontend_redirect_uri:
             request.session['frontend_redirect_uri'] = frontend_redirect_uri
         
-        auth_url = self.google_oauth.get_auth_url(state=state)
+        auth_url = self._require_google_oauth().get_auth_url(state=state)
         return auth_url
     
     def redirect_to_google(self, auth_url: str):
@@ -54,6 +65,7 @@ class AuthController:
     
     async def handle_google_callback(self, code: str, state: str, request: Request, return_json: bool = False):
         """Handle Google OAuth2 callback and redirect to frontend or return JSON"""
+        self._require_google_oauth()
         if not code:
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
@@ -70,7 +82,7 @@ class AuthController:
                 pass
             
             # Exchange code for tokens
-            token_data = self.google_oauth.exchange_code_for_token(code)
+            token_data = await self.google_oauth.exchange_code_for_token(code)
             access_token = token_data.get('access_token')
             id_token_str = token_data.get('id_token')
             
@@ -80,14 +92,14 @@ class AuthController:
                     detail="Failed to get access token"
                 )
             
-            # Get user info from Google
-            user_info = self.google_oauth.get_user_info(access_token)
-            
-            # Alternatively, verify ID token (more secure)
+            # Trust the locally verified ID token; only call the userinfo
+            # endpoint when it is missing or lacks the claims we store
+            user_info = None
             if id_token_str:
-                verified_info = self.google_oauth.verify_id_token(id_token_str)
-                if verified_info:
-                    user_info = verified_info
+                user_info = await self.google_oauth.verify_id_token(id_token_str)
+            if not user_info or not all(user_info.get(k) for k in ("sub", "email", "name")):
+                fetched = await self.google_oauth.get_user_info(access_token)
+                user_info = {**fetched, **(user_info or {})}
             
             # Store or update user in MongoDB
             user_data = await self._store_or_update_user(user_info)
@@ -194,11 +206,7 @@ class AuthController:
 
             if email is not None and email != current_user.get("email"):
                 # Ensure email uniqueness
-                existing = self.db.users.find_one({
-                    "email": email,
-                    "_id": {"$ne": user_id}
-                })
-                if existing:
+                if await self.users.email_taken(email, user_id):
                     raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Email already in use")
                 updates["email"] = email
 
@@ -211,11 +219,9 @@ class AuthController:
 
             updates["updated_at"] = datetime.utcnow().isoformat()
 
-            # Apply update
-            self.db.users.update_one({"_id": user_id}, {"$set": updates})
-
-            # Fetch updated user
-            updated = self.db.users.find_one({"_id": user_id})
+            # Apply update and fetch the updated user in one round trip
+            updated = await self.users.update_and_get(user_id, updates)
+            invalidate_user(user_id)
             if not updated:
                 raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="User not found")
 
@@ -235,6 +241,17 @@ class AuthController:
                 detail=f"Failed to update profile: {str(e)}"
             )
     
+    async def _bcrypt(self, operation):
+        """Await a password_hasher operation, mapping saturation to 503"""
+        try:
+            return await operation
+        except HasherSaturatedError:
+            raise HTTPException(
+                status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                detail="Too many login attempts in progress, please retry shortly",
+                headers={"Retry-After": "1"}
+            )
+
     async def _store_or_update_user(self, user_info):
         """Store or update user in MongoDB"""
         google_id = user_info.get("id") or user_info.get("sub")
@@ -246,12 +263,7 @@ class AuthController:
             raise ValueError("Missing required user information")
         
         # Check if user exists
-        existing_user = self.db.users.find_one({
-            "$or": [
-                {"google_sub": google_id},
-                {"email": email}
-            ]
-        })
+        existing_user = await self.users.find_by_google_sub_or_email(google_id, email)
         
         current_time = datetime.utcnow().isoformat()  # Convert to string format
         
@@ -266,32 +278,34 @@ class AuthController:
         }
         
         if existing_user:
-            # Update existing user
-            self.db.users.update_one(
-                {"_id": existing_user["_id"]},
-                {"$set": user_data}
-            )
+            # Update existing user; role and token_version stay as stored so
+            # the token matches them (a role change bumps token_version, and
+            # stateless mode rejects tokens signed with an older one)
+            user_data.pop("role")
+            stored = await self.users.update_and_get(existing_user["_id"], user_data) or existing_user
+            invalidate_user(existing_user["_id"])
             user_data["_id"] = existing_user["_id"]
-            user_data["created_at"] = existing_user.get("created_at", current_time)
+            user_data["role"] = stored.get("role", "user")
+            user_data["token_version"] = stored.get("token_version", 0)
+            user_data["created_at"] = stored.get("created_at", current_time)
         else:
             # Create new user
             user_data["created_at"] = current_time  # String format for MongoDB schema
-            result = self.db.users.insert_one(user_data)
-            user_data["_id"] = result.inserted_id
+            user_data["_id"] = await self.users.insert(user_data)
         
         return user_data
     
     async def register_user(self, data):
         """Register a new user with name, email, password"""
         # Check if user already exists
-        existing = self.db.users.find_one({"email": data.email})
+        existing = await self.users.find_by_email(data.email)
         if existing:
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail="User with this email already exists"
             )
-        # Hash password
-        hashed_password = bcrypt.hash(data.password)
+        # Hash password off the event loop
+        hashed_password = await self._bcrypt(password_hasher.hash(data.password))
         now = datetime.utcnow().isoformat()
         user_doc = {
             "name": data.name,
@@ -303,8 +317,7 @@ class AuthController:
             "password": hashed_password,
             "picture": ""
         }
-        result = self.db.users.insert_one(user_doc)
-        user_doc["_id"] = result.inserted_id
+        user_doc["_id"] = await self.users.insert(user_doc)
         return {
             "_id": str(user_doc["_id"]),
             "name": user_doc["name"],
@@ -314,19 +327,31 @@ class AuthController:
             "created_at": user_doc["created_at"]
         }
 
-    async def password_login(self, data):
+    async def _upgrade_password_hash(self, user_id, password: str) -> None:
+        try:
+            new_hash = await password_hasher.rehash(password)
+        except HasherSaturatedError:
+            return  # Retry on a later login
+        await self.users.update(user_id, {"password": new_hash})
+        invalidate_user(user_id)
+
+    async def password_login(self, data, background_tasks: BackgroundTasks):
         """Login with email and password"""
-        user = self.db.users.find_one({"email": data.email})
+        user = await self.users.find_by_email(data.email)
         if not user or not user.get("password"):
             raise HTTPException(
                 status_code=status.HTTP_401_UNAUTHORIZED,
                 detail="Invalid email or password"
             )
-        if not bcrypt.verify(data.password, user["password"]):
+        if not await self._bcrypt(password_hasher.verify(data.password, user["password"])):
             raise HTTPException(
                 status_code=status.HTTP_401_UNAUTHORIZED,
                 detail="Invalid email or password"
             )
+        # Transparently upgrade hashes made with a different BCRYPT_ROUNDS, after
+        # the response is sent so the login does not wait for a second bcrypt
+        if password_hasher.needs_rehash(user["password"]):
+            background_tasks.add_task(self._upgrade_password_hash, user["_id"], data.password)
         token = create_jwt_token(user)
         return {
             "access_token": token,
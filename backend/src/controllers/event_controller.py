@@ -1,109 +1,202 @@
-from models.event import Event
-from config.db import get_db_connection
-from bson import ObjectId
+from models.event import Event, EventCreateRequest, EventUpdateRequest, allowed_sources, check_duration, duration_filter, to_utc_naive
+from config.db import get_db
+from repositories import EventRepository
 from datetime import datetime
 from fastapi import HTTPException
+from bson import ObjectId
+from bson.errors import InvalidId
+from pydantic import ValidationError
+from pymongo import DeleteOne, InsertOne, UpdateOne
+from pymongo.errors import BulkWriteError
+from repositories.event_stats import STAT_FIELDS
+
+def _new_event_doc(request, current_user) -> dict:
+    now = to_utc_naive(datetime.utcnow())
+    return {
+        "title": request.title,
+        "description": request.description,
+        "organizer_id": str(current_user["_id"]),
+        "start_time": to_utc_naive(request.start_time),
+        "end_time": to_utc_naive(request.end_time),
+        "status": "draft",
+        "created_at": now,
+        "updated_at": now,
+    }
 
 # CREATE EVENT
 async def create_event_controller(request, current_user):
     try:
-        db = get_db_connection()
-        organizer_id = str(current_user["_id"])
-        start_time = request.start_time.isoformat()
-        end_time = request.end_time.isoformat()
-        now = datetime.utcnow().isoformat()
-        event_data = {
-            "title": request.title,
-            "description": request.description,
-            "organizer_id": organizer_id,
-            "start_time": start_time,
-            "end_time": end_time,
-            "status": "draft",
-            "created_at": now,
-            "updated_at": now,
-        }
-        result = db.events.insert_one(event_data)
-        event_data["_id"] = str(result.inserted_id)
+        events_repo = EventRepository(get_db())
+        event_data = _new_event_doc(request, current_user)
+        inserted_id = await events_repo.insert(event_data)
+        event_data["_id"] = str(inserted_id)
         return event_data
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Event creation failed: {str(e)}")
 
-# UPDATE EVENT
-async def update_event_controller(event_id, update, current_user):
-    try:
-        db = get_db_connection()
-        event = db.events.find_one({"_id": ObjectId(event_id)})
-        if not event:
-            raise HTTPException(status_code=404, detail="Event not found")
-        if current_user["role"] != "admin" and str(event["organizer_id"]) != str(current_user["_id"]):
-            raise HTTPException(status_code=403, detail="Forbidden")
-        allowed_fields = ["title", "description", "start_time", "end_time"]
-        update_data = {}
-        for field in allowed_fields:
-            value = getattr(update, field, None)
-            if value is not None:
-                if field in ["start_time", "end_time"] and hasattr(value, "isoformat"):
-                    value = value.isoformat()
-                update_data[field] = value
-        update_data["updated_at"] = datetime.utcnow().isoformat()
-        db.events.update_one({"_id": ObjectId(event_id)}, {"$set": update_data})
-        event.update(update_data)
-        event["_id"] = str(event["_id"])
-        return event
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Event update failed: {str(e)}")
-
-# APPROVE EVENT
-async def approve_event_controller(event_id, current_user):
-    try:
-        if current_user["role"] != "admin":
-            raise HTTPException(status_code=403, detail="Forbidden")
-        db = get_db_connection()
-        event = db.events.find_one({"_id": ObjectId(event_id)})
-        if not event:
-            raise HTTPException(status_code=404, detail="Event not found")
-        update_data = {
-            "status": "approved",
-            "approved_by": str(current_user["_id"]),
-            "updated_at": datetime.utcnow().isoformat()
-        }
-        db.events.update_one({"_id": ObjectId(event_id)}, {"$set": update_data})
-        event.update(update_data)
-        event["_id"] = str(event["_id"])
-        return event
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Event approval failed: {str(e)}")
-
-# ARCHIVE EVENT
-async def archive_event_controller(event_id, current_user):
-    try:
-        if current_user["role"] not in ["core_member", "admin"]:
-            raise HTTPException(status_code=403, detail="Forbidden")
-        db = get_db_connection()
-        event = db.events.find_one({"_id": ObjectId(event_id)})
-        if not event:
-            raise HTTPException(status_code=404, detail="Event not found")
-        update_data = {
-            "status": "archived",
-            "archived_at": datetime.utcnow().isoformat(),
-            "updated_at": datetime.utcnow().isoformat()
-        }
-        db.events.update_one({"_id": ObjectId(event_id)}, {"$set": update_data})
-        event.update(update_data)
-        event["_id"] = str(event["_id"])
-        return event
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Event archive failed: {str(e)}")
-
 # DELETE EVENT
 async def delete_event_controller(event_id, current_user):
     try:
         if current_user["role"] != "admin":
             raise HTTPException(status_code=403, detail="Forbidden")
-        db = get_db_connection()
-        result = db.events.delete_one({"_id": ObjectId(event_id)})
-        if result.deleted_count == 0:
+        events_repo = EventRepository(get_db())
+        deleted = await events_repo.delete(event_id)
+        if deleted == 0:
             raise HTTPException(status_code=404, detail="Event not found")
         return {"message": "Event deleted successfully"}
     except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Event deletion failed: {str(e)}")
\ No newline at end of file
+        raise HTTPException(status_code=500, detail=f"Event deletion failed: {str(e)}")
+
+# BULK OPERATIONS
+_BULK_ROLES = {
+    "create": ("core_member", "admin"),
+    "update": ("user", "core_member", "admin"),  # ownership checked per event
+    "approve": ("admin",),
+    "archive": ("core_member", "admin"),
+    "delete": ("admin",),
+}
+
+async def bulk_events_controller(operations, current_user):
+    """
+    Validate every operation, prefetch all referenced events in one query for
+    per-item permission/state checks, then run the surviving writes as one
+    unordered bulk_write. Preconditions are repeated in each write filter, so
+    an event changed in between is left untouched rather than overwritten.
+    """
+    events_repo = EventRepository(get_db())
+    role = current_user["role"]
+    user_id = str(current_user["_id"])
+    results = [{"index": i, "op": op.op, "id": op.id, "ok": False} for i, op in enumerate(operations)]
+
+    # Pass 1: role checks, id/payload validation
+    target_ids = {}
+    for i, op in enumerate(operations):
+        if role not in _BULK_ROLES[op.op]:
+            results[i]["error"] = "Forbidden"
+            continue
+        if op.op == "create":
+            continue
+        try:
+            oid = ObjectId(op.id)
+        except (InvalidId, TypeError):
+            results[i]["error"] = "Invalid or missing id"
+            continue
+        # Each event may appear once: a second op would be checked against the
+        # prefetched state, not against the first op's result
+        if oid in target_ids.values():
+            results[i]["error"] = "Duplicate id in batch"
+            continue
+        target_ids[i] = oid
+
+    existing = {
+        e["_id"]: e
+        for e in await events_repo.find_by_ids(list(set(target_ids.values())), {**STAT_FIELDS, "end_time": 1})
+    } if target_ids else {}
+
+    # Pass 2: build write models for the operations that passed their checks.
+    # Every update carries this stamp, which tells afterwards which ones matched
+    now = to_utc_naive(datetime.utcnow())
+    # request_images[n] is the (before, after) of requests[n], for the stats counters
+    requests, request_index, request_images = [], [], []
+    for i, op in enumerate(operations):
+        if "error" in results[i]:
+            continue
+        try:
+            if op.op == "create":
+                doc = _new_event_doc(EventCreateRequest(**(op.data or {})), current_user)
+                requests.append(InsertOne(doc))
+                results[i]["id"] = doc["_id"] = ObjectId()
+                request_index.append(i)
+                request_images.append((None, doc))
+                continue
+
+            oid = target_ids[i]
+            event = existing.get(oid)
+            if event is None:
+                results[i]["error"] = "Event not found"
+                continue
+
+            if op.op == "update":
+                if role != "admin" and str(event["organizer_id"]) != user_id:
+                    results[i]["error"] = "Forbidden"
+                    continue
+                update = EventUpdateRequest(**(op.data or {}))
+                update_data = {
+                    k: (to_utc_naive(v) if isinstance(v, datetime) else v)
+                    for k, v in update.dict(exclude_unset=True).items()
+                }
+                merged = {**event, **update_data}
+                if isinstance(merged.get("start_time"), datetime) and isinstance(merged.get("end_time"), datetime):
+                    try:
+                        check_duration(merged["start_time"], merged["end_time"])
+                    except ValueError as e:
+                        results[i]["error"] = f"Invalid data: {e}"
+                        continue
+                update_data["updated_at"] = now
+                query = {"_id": oid, "organizer_id": event["organizer_id"], **duration_filter(update_data)}
+                requests.append(UpdateOne(query, {"$set": update_data}))
+                after = {**event, **update_data}
+            elif op.op in ("approve", "archive"):
+                target = "approved" if op.op == "approve" else "archived"
+                if event.get("status") not in allowed_sources(target):
+                    results[i]["error"] = f"Cannot move event from '{event.get('status')}' to '{target}'"
+                    continue
+                update_data = {"status": target, "updated_at": now}
+                if target == "approved":
+                    update_data["approved_by"] = user_id
+                else:
+                    update_data["archived_at"] = now
+                query = {"_id": oid, "status": {"$in": list(allowed_sources(target))}}
+                requests.append(UpdateOne(query, {"$set": update_data}))
+                after = {**event, **update_data}
+            else:
+                requests.append(DeleteOne({"_id": oid}))
+                after = None
+            request_index.append(i)
+            request_images.append((event, after))
+        except ValidationError as e:
+            results[i]["error"] = f"Invalid data: {e.errors()[0].get('msg')}"
+
+    summary = {"requested": len(operations), "submitted": len(requests)}
+    if requests:
+        write_errors = {}
+        try:
+            result = await events_repo.bulk_write(requests)
+            details = result.bulk_api_result
+        except BulkWriteError as e:
+            details = e.details
+            write_errors = {err["index"]: err.get("errmsg", "Write failed") for err in details.get("writeErrors", [])}
+        applied = [p for p in range(len(requests)) if p not in write_errors]
+        updates = [p for p in applied if isinstance(requests[p], UpdateOne)]
+        deletes = [p for p in applied if isinstance(requests[p], DeleteOne)]
+        if details.get("nMatched", 0) < len(updates):
+            # Some preconditions failed at write time (a concurrent change);
+            # only events carrying this batch's stamp were written
+            ids = [request_images[p][0]["_id"] for p in updates]
+            stamped = {e["_id"] for e in await events_repo.find_by_ids(ids, {"updated_at": 1}) if e.get("updated_at") == now}
+            for p in updates:
+                if request_images[p][0]["_id"] not in stamped:
+                    write_errors[p] = "Event changed during the batch; nothing was written"
+        for position, i in enumerate(request_index):
+            if position in write_errors:
+                results[i]["error"] = write_errors[position]
+            else:
+                results[i]["ok"] = True
+        written = [image for position, image in enumerate(request_images) if position not in write_errors]
+        if details.get("nRemoved", 0) < len(deletes):
+            # Another writer deleted some of these events as well; which
+            # removals were ours is unknown, so recount instead of applying a delta
+            await events_repo.stats.reconcile()
+            written = []
+        await events_repo.record_writes(written)
+        summary.update({
+            "inserted": details.get("nInserted", 0),
+            "matched": details.get("nMatched", 0),
+            "modified": details.get("nModified", 0),
+            "deleted": details.get("nRemoved", 0),
+        })
+
+    for r in results:
+        if r["id"] is not None:
+            r["id"] = str(r["id"])
+    return {"results": results, "summary": summary}
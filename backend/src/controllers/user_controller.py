@@ -1,29 +1,28 @@
-from bson import ObjectId
-from config.db import get_db_connection
+from config.db import get_db, get_read_db
+from repositories import UserRepository
+from services.user_cache import invalidate_user
+from services.token_versions import token_versions
 
-def get_all_users():
-    db = get_db_connection()
-    users = list(db.users.find({}, {"password": 0}))
+async def get_all_users():
+    users = await UserRepository(get_read_db()).list_all()
     for u in users:
         u["id"] = str(u["_id"])
         u.pop("_id", None)
     return users
 
-def update_user_role(user_id: str, role: str):
-    db = get_db_connection()
-    user = db.users.find_one({"_id": ObjectId(user_id)})
+async def update_user_role(user_id: str, role: str):
+    users_repo = UserRepository(get_db())
+    user = await users_repo.find_by_id(user_id)
     if not user:
         return None
     if user.get("role") == "admin":
         # Prevent changing admin role
         return "admin_locked"
-    result = db.users.find_one_and_update(
-        {"_id": ObjectId(user_id)},
-        {"$set": {"role": role}},
-        return_document=True
-    )
+    result = await users_repo.set_role(user_id, role)
+    invalidate_user(user_id)
     if not result:
         return None
+    token_versions.set(user_id, result.get("token_version", 0))
     result["id"] = str(result["_id"])
     result.pop("_id", None)
     result.pop("password", None)
@@ -1,13 +1,46 @@
-from fastapi import Depends, HTTPException, status
+from fastapi import Depends, HTTPException, Query, Request, status
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from typing import Optional
-from config.jwt_config import verify_token
-from config.db import get_db_connection
+from config.jwt_config import verify_token, JWT_STATELESS_CLAIMS, STREAM_TOKEN_SCOPE
+from config.db import get_db, get_read_db
+from repositories import UserRepository, EventRepository
+from services.user_cache import get_cached_user, cache_user
+from services.token_versions import token_versions
 from bson import ObjectId
 
 security = HTTPBearer()
 
-async def get_current_user(credentials: HTTPAuthorizationCredentials = Depends(security)):
+# Repository dependencies are async so FastAPI resolves them on the event loop
+# instead of dispatching to its threadpool
+async def get_user_repository() -> UserRepository:
+    """Dependency providing the async users repository"""
+    return UserRepository(get_db())
+
+async def get_event_repository() -> EventRepository:
+    """Dependency providing the async events repository"""
+    return EventRepository(get_db())
+
+async def get_auth_controller(request: Request):
+    """Dependency returning the shared AuthController"""
+    return request.app.state.services.auth_controller
+
+# Read-only variants routed per MONGO_READ_PREFERENCE (may hit secondaries);
+# use the primary repositories above wherever a request reads its own writes
+async def get_user_read_repository() -> UserRepository:
+    """Dependency providing a users repository for read-only lookups"""
+    return UserRepository(get_read_db())
+
+async def get_event_read_repository() -> EventRepository:
+    """Dependency providing an events repository for read-only endpoints"""
+    return EventRepository(get_read_db())
+
+async def get_current_user(
+    credentials: HTTPAuthorizationCredentials = Depends(security),
+    # Primary, not the read repository: a user who just registered (or whose
+    # role just changed) must not be looked up on a lagging secondary, and a
+    # stale result would be cached. The user cache absorbs most of this load.
+    users: UserRepository = Depends(get_user_repository)
+):
     """Dependency to get current user from JWT token"""
     token = credentials.credentials
     
@@ -27,9 +60,30 @@ async def get_current_user(credentials: HTTPAuthorizationCredentials = Depends(s
             headers={"WWW-Authenticate": "Bearer"},
         )
     
-    # Get user from database
-    db = get_db_connection()
-    user = db.users.find_one({"_id": ObjectId(user_id)})
+    # Stateless mode: authorize from signed claims, checking only the revocation map
+    if JWT_STATELESS_CLAIMS and "role" in payload:
+        if not token_versions.is_current(user_id, payload.get("tv", 0)):
+            raise HTTPException(
+                status_code=status.HTTP_401_UNAUTHORIZED,
+                detail="Token has been revoked",
+                headers={"WWW-Authenticate": "Bearer"},
+            )
+        return {
+            "_id": ObjectId(user_id),
+            "name": payload.get("name", ""),
+            "email": payload.get("email", ""),
+            "picture": payload.get("picture", ""),
+            "role": payload["role"],
+            "created_at": payload.get("created_at"),
+            "token_version": payload.get("tv", 0),
+        }
+
+    # Serve from the user cache; fall back to the database on a miss
+    user = get_cached_user(user_id)
+    if user is not None:
+        return user
+
+    user = await users.find_by_id(user_id)
     
     if user is None:
         raise HTTPException(
@@ -38,14 +92,41 @@ async def get_current_user(credentials: HTTPAuthorizationCredentials = Depends(s
             headers={"WWW-Authenticate": "Bearer"},
         )
     
+    cache_user(user)
     return user
 
-async def get_current_user_optional(credentials: Optional[HTTPAuthorizationCredentials] = Depends(HTTPBearer(auto_error=False))):
+async def get_current_user_optional(
+    credentials: Optional[HTTPAuthorizationCredentials] = Depends(HTTPBearer(auto_error=False)),
+    users: UserRepository = Depends(get_user_repository)
+):
     """Optional dependency to get current user from JWT token"""
     if not credentials:
         return None
     
     try:
-        return await get_current_user(credentials)
+        return await get_current_user(credentials, users)
     except HTTPException:
         return None
+
+async def get_stream_user_id(
+    token: Optional[str] = Query(None, description="Token from POST /events/stream/token (for EventSource)"),
+    credentials: Optional[HTTPAuthorizationCredentials] = Depends(HTTPBearer(auto_error=False)),
+    users: UserRepository = Depends(get_user_repository)
+) -> str:
+    """
+    Authenticate an event stream either with a short-lived stream token in the
+    query string (browsers' EventSource cannot set headers) or the usual Bearer header
+    """
+    if token:
+        payload = verify_token(token)
+        if payload is None or payload.get("scope") != STREAM_TOKEN_SCOPE or not payload.get("sub"):
+            raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid or expired stream token")
+        return payload["sub"]
+    if credentials:
+        user = await get_current_user(credentials, users)
+        return str(user["_id"])
+    raise HTTPException(
+        status_code=status.HTTP_401_UNAUTHORIZED,
+        detail="Not authenticated",
+        headers={"WWW-Authenticate": "Bearer"},
+    )
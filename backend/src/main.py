@@ -1,12 +1,105 @@
-from fastapi import FastAPI
+from contextlib import asynccontextmanager
+from fastapi import Depends, FastAPI, HTTPException, status
 from fastapi.middleware.cors import CORSMiddleware
 from starlette.middleware.sessions import SessionMiddleware
 import os
+import asyncio
+import logging
 from dotenv import load_dotenv
 
 # Load environment variables
 load_dotenv()
 
+# Response headers browsers may read cross-origin (pagination, caching)
+EXPOSED_HEADERS = ["X-Next-Cursor", "Link", "ETag", "Last-Modified", "X-Cache", "X-Result-Truncated"]
+
+def _log_prefetch_failure(task: asyncio.Task) -> None:
+    if not task.cancelled() and task.exception():
+        logging.warning("Could not prefetch Google certs: %s", task.exception())
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """
+    Open shared resources once per process and release them on shutdown
+    """
+    from config.db import init_db, close_db
+    from config.jwt_config import JWT_STATELESS_CLAIMS
+    from services.token_versions import token_versions
+    from services.password_hasher import password_hasher
+    from services.http_client import init_http_client, close_http_client
+    from services.google_certs import google_certs
+    from services.event_stream import event_hub
+    from utils_dir.periodic import PeriodicTask
+
+    # One pooled MongoClient for the whole process (primary/fallback failover runs here)
+    db = await init_db()
+
+    # Ensure indexes / apply schema migrations (disable with DB_RUN_MIGRATIONS=false
+    # and run `python -m migrations` from a deploy step instead)
+    if os.getenv("DB_RUN_MIGRATIONS", "true").lower() in ("1", "true", "yes"):
+        from migrations import run_migrations
+        await run_migrations(db)
+
+    # Application-scoped services (OAuth, storage, controllers) built once
+    from services.container import ServiceContainer
+    app.state.services = ServiceContainer()
+    app.state.services.validate()
+
+    # Shared keep-alive HTTP client for outbound calls (Google OAuth)
+    init_http_client()
+
+    # Prime Google's ID-token signing certs in the background so the first
+    # login skips the fetch without delaying startup
+    certs_prefetch = None
+    if app.state.services.google_oauth is not None:
+        certs_prefetch = asyncio.create_task(google_certs.get())
+        certs_prefetch.add_done_callback(_log_prefetch_failure)
+
+    # Stateless JWT mode: keep the token revocation map fresh in the background
+    refresh_task = None
+    if JWT_STATELESS_CLAIMS:
+        await token_versions.refresh(db)
+        refresh_task = PeriodicTask(
+            "token-version-refresh",
+            float(os.getenv("TOKEN_VERSION_REFRESH_SECONDS", "30")),
+            lambda: token_versions.refresh(db),
+        )
+        refresh_task.start()
+
+    # Fan-out hub for GET /events/stream (and the change stream watcher, if enabled)
+    await event_hub.start(db)
+
+    # Repair drift in the incrementally maintained event stats counters
+    stats_task = None
+    stats_interval = float(os.getenv("EVENT_STATS_RECONCILE_SECONDS", "3600"))
+    if stats_interval > 0:
+        from repositories import EventStatsRepository
+        stats_task = PeriodicTask("event-stats-reconcile", stats_interval, EventStatsRepository(db).reconcile)
+        stats_task.start()
+
+    # Archive events that have ended; a lock document elects one worker to do it
+    from services.auto_archiver import auto_archiver, AUTO_ARCHIVE_INTERVAL_SECONDS
+    archive_task = None
+    if AUTO_ARCHIVE_INTERVAL_SECONDS > 0:
+        archive_task = PeriodicTask("auto-archive", AUTO_ARCHIVE_INTERVAL_SECONDS, lambda: auto_archiver.run(db))
+        archive_task.start()
+    try:
+        yield
+    finally:
+        if certs_prefetch:
+            certs_prefetch.cancel()
+        await event_hub.stop()
+        if refresh_task:
+            await refresh_task.stop()
+        if stats_task:
+            await stats_task.stop()
+        if archive_task:
+            await archive_task.stop()
+            await auto_archiver.release(db)
+        password_hasher.shutdown()
+        await close_http_client()
+        close_db()
+
 def create_app():
     """
     Application factory pattern
@@ -14,7 +107,8 @@ def create_app():
     app = FastAPI(
         title="Club Event Storage API",
         description="FastAPI backend with Google OAuth2 and JWT authentication",
-        version="1.0.0"
+        version="1.0.0",
+        lifespan=lifespan
     )
 
     # Configure CORS from env or use sane defaults for localhost
@@ -27,6 +121,7 @@ def create_app():
             allow_credentials=False,
             allow_methods=["*"],
             allow_headers=["*"],
+            expose_headers=EXPOSED_HEADERS,
         )
     else:
         default_origins = [
@@ -46,6 +141,7 @@ def create_app():
             allow_credentials=True,
             allow_methods=["*"],
             allow_headers=["*"],
+            expose_headers=EXPOSED_HEADERS,
         )
 
     # Add session middleware
@@ -61,6 +157,7 @@ def create_app():
     from routes.users import router as users_router
     from routes.auth import router as auth_router
     from routes.events import router as events_router
+    from dependencies import get_current_user
     
     app.include_router(auth_router)
     app.include_router(users_router)
@@ -72,7 +169,36 @@ def create_app():
 
     @app.get("/health")
     async def health():
-        return {"status": "healthy"}
+        from config.db import get_warmup_stats
+        return {"status": "healthy", "db_warmup_ms": get_warmup_stats()}
+
+    @app.get("/metrics")
+    async def metrics(current_user: dict = Depends(get_current_user)):
+        """In-process cache counters for this worker (admin only)"""
+        if current_user["role"] != "admin":
+            raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Admin access required")
+        from services.user_cache import user_cache
+        from services.token_versions import token_versions
+        from config.jwt_config import token_cache
+        from services.password_hasher import password_hasher
+        from services.http_client import http_stats
+        from services.google_certs import google_certs
+        from services.rate_limiter import rate_limit_stats
+        from services.event_cache import event_cache_stats
+        from services.event_stream import event_hub
+        from services.auto_archiver import auto_archiver
+        return {
+            "user_cache": user_cache.stats(),
+            "token_cache": token_cache.stats(),
+            "token_versions": token_versions.stats(),
+            "password_hasher": password_hasher.stats(),
+            "http": http_stats(),
+            "google_certs": google_certs.stats(),
+            "rate_limits": rate_limit_stats(),
+            "event_cache": event_cache_stats(),
+            "event_stream": event_hub.stats(),
+            "auto_archive": auto_archiver.stats(),
+        }
 
     return app
 
@@ -0,0 +1,9 @@
+# This file makes the migrations directory a Python package
+from migrations.manager import (
+    MIGRATIONS,
+    applied_versions,
+    index_usage_report,
+    migration,
+    run_migrations,
+)
+import migrations.versions  # noqa: F401  (registers the migrations)
@@ -0,0 +1,38 @@
+"""
+Run schema migrations / index management from the command line.
+
+Usage (from backend/src):
+    python -m migrations            # apply pending migrations
+    python -m migrations status     # list applied and pending versions
+    python -m migrations report     # index usage per collection
+"""
+import asyncio
+import json
+import sys
+
+from config.db import init_db, close_db
+from migrations import MIGRATIONS, applied_versions, index_usage_report, run_migrations
+
+
+async def _main(command: str) -> int:
+    db = await init_db()
+    try:
+        if command == "status":
+            done = set(await applied_versions(db))
+            for m in MIGRATIONS:
+                print(f"[{'x' if m.version in done else ' '}] {m}")
+        elif command == "report":
+            print(json.dumps(await index_usage_report(db), indent=2, default=str))
+        elif command == "apply":
+            applied = await run_migrations(db)
+            print(f"Applied: {applied}" if applied else "Nothing to apply")
+        else:
+            print(__doc__)
+            return 2
+        return 0
+    finally:
+        close_db()
+
+
+if __name__ == "__main__":
+    sys.exit(asyncio.run(_main(sys.argv[1] if len(sys.argv) > 1 else "apply")))
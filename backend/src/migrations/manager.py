@@ -0,0 +1,84 @@
+import logging
+from datetime import datetime
+from typing import Awaitable, Callable, Dict, List, Optional
+
+MIGRATIONS_COLLECTION = "schema_migrations"
+
+
+class Migration:
+    def __init__(self, version: int, description: str, apply: Callable[..., Awaitable[None]]):
+        self.version = version
+        self.description = description
+        self.apply = apply
+
+    def __str__(self):
+        return f"{self.version:04d} {self.description}"
+
+
+# Registered migrations, kept sorted by version
+MIGRATIONS: List[Migration] = []
+
+
+def migration(version: int, description: str):
+    """Decorator registering an async `apply(db)` function as a schema migration"""
+    def register(func: Callable[..., Awaitable[None]]):
+        if any(m.version == version for m in MIGRATIONS):
+            raise ValueError(f"Duplicate migration version {version}")
+        MIGRATIONS.append(Migration(version, description, func))
+        MIGRATIONS.sort(key=lambda m: m.version)
+        return func
+    return register
+
+
+async def applied_versions(db) -> List[int]:
+    docs = await db[MIGRATIONS_COLLECTION].find({}, {"_id": 1}).to_list(length=None)
+    return sorted(doc["_id"] for doc in docs)
+
+
+async def run_migrations(db, target: Optional[int] = None) -> List[int]:
+    """
+    Apply pending migrations in version order and record each one in
+    `schema_migrations`. Index builds are idempotent, so two workers starting
+    at once may both run a step without harm.
+
+    Returns the versions applied by this call.
+    """
+    done = set(await applied_versions(db))
+    applied: List[int] = []
+    for m in MIGRATIONS:
+        if m.version in done or (target is not None and m.version > target):
+            continue
+        logging.info("Applying migration %s", m)
+        started = datetime.utcnow()
+        await m.apply(db)
+        await db[MIGRATIONS_COLLECTION].update_one(
+            {"_id": m.version},
+            {"$set": {
+                "description": m.description,
+                "applied_at": datetime.utcnow(),
+                "duration_ms": int((datetime.utcnow() - started).total_seconds() * 1000),
+            }},
+            upsert=True
+        )
+        applied.append(m.version)
+    return applied
+
+
+async def index_usage_report(db, collections=("users", "events", "files")) -> Dict[str, List[dict]]:
+    """
+    Per-collection index usage from $indexStats (ops served since the
+    mongod last restarted), to spot unused indexes or missing ones.
+    """
+    report: Dict[str, List[dict]] = {}
+    for name in collections:
+        stats = await db[name].aggregate([{"$indexStats": {}}]).to_list(length=None)
+        report[name] = [
+            {
+                "name": s["name"],
+                "key": dict(s["key"]),
+                "ops": s.get("accesses", {}).get("ops", 0),
+                "since": s.get("accesses", {}).get("since"),
+            }
+            for s in stats
+        ]
+    return report
@@ -0,0 +1,161 @@
+import logging
+from datetime import datetime, timezone
+from pymongo import ASCENDING, TEXT, IndexModel, UpdateOne
+from pymongo.errors import OperationFailure
+from migrations.manager import migration
+from models.event import EVENT_DATETIME_FIELDS
+from repositories.event_stats import EventStatsRepository
+
+# Documents rewritten per bulk_write by data migrations
+BATCH_SIZE = 500
+# Server error code for dropping an index that does not exist
+INDEX_NOT_FOUND = 27
+
+
+@migration(1, "users: unique email, unique google_sub for OAuth users")
+async def users_indexes(db):
+    await db.users.create_indexes([
+        IndexModel([("email", ASCENDING)], name="email_unique", unique=True),
+        # Password users store google_sub as "", so a plain sparse index would
+        # collide on the empty string; index only non-empty subs instead.
+        IndexModel(
+            [("google_sub", ASCENDING)],
+            name="google_sub_unique",
+            unique=True,
+            partialFilterExpression={"google_sub": {"$gt": ""}},
+        ),
+    ])
+
+
+@migration(2, "events: {status, start_time} listings, organizer_id lookups")
+async def events_indexes(db):
+    await db.events.create_indexes([
+        IndexModel([("status", ASCENDING), ("start_time", ASCENDING)], name="status_start_time"),
+        IndexModel([("organizer_id", ASCENDING)], name="organizer_id"),
+    ])
+
+
+@migration(3, "files: {event_id, uploaded_at} for per-event file lookups")
+async def files_indexes(db):
+    await db.files.create_indexes([
+        IndexModel([("event_id", ASCENDING), ("uploaded_at", ASCENDING)], name="event_id_uploaded_at"),
+    ])
+
+
+@migration(4, "events: keyset pagination indexes on (start_time, _id)")
+async def events_pagination_indexes(db):
+    await db.events.create_indexes([
+        IndexModel([("start_time", ASCENDING), ("_id", ASCENDING)], name="start_time_id"),
+        IndexModel(
+            [("status", ASCENDING), ("start_time", ASCENDING), ("_id", ASCENDING)],
+            name="status_start_time_id",
+        ),
+    ])
+    # Superseded by status_start_time_id (same prefix)
+    if "status_start_time" in await db.events.index_information():
+        try:
+            await db.events.drop_index("status_start_time")
+        except OperationFailure as e:
+            # Another worker migrating at the same time dropped it first
+            if e.code != INDEX_NOT_FOUND:
+                raise
+
+
+def _parse_iso(value: str):
+    try:
+        parsed = datetime.fromisoformat(value)
+    except ValueError:
+        return None
+    if parsed.tzinfo is not None:
+        parsed = parsed.astimezone(timezone.utc).replace(tzinfo=None)
+    return parsed
+
+
+@migration(5, "events: convert ISO string timestamps to native datetimes")
+async def events_native_datetimes(db):
+    # Walk in _id order so unparseable values are skipped rather than revisited
+    query = {"$or": [{f: {"$type": "string"}} for f in EVENT_DATETIME_FIELDS]}
+    projection = {f: 1 for f in EVENT_DATETIME_FIELDS}
+    last_id, converted, skipped = None, 0, 0
+    while True:
+        batch_query = query if last_id is None else {"$and": [query, {"_id": {"$gt": last_id}}]}
+        batch = await db.events.find(batch_query, projection).sort("_id", ASCENDING).limit(BATCH_SIZE).to_list(length=BATCH_SIZE)
+        if not batch:
+            break
+        requests = []
+        for doc in batch:
+            updates = {}
+            for field in EVENT_DATETIME_FIELDS:
+                value = doc.get(field)
+                if not isinstance(value, str):
+                    continue
+                parsed = _parse_iso(value)
+                if parsed is None:
+                    skipped += 1
+                    continue
+                updates[field] = parsed
+            if updates:
+                # Guard on the original strings so a concurrent edit is not overwritten
+                guard = {"_id": doc["_id"], **{f: doc[f] for f in updates}}
+                requests.append(UpdateOne(guard, {"$set": updates}))
+        if requests:
+            result = await db.events.bulk_write(requests, ordered=False)
+            converted += result.modified_count
+        last_id = batch[-1]["_id"]
+    logging.info("Converted %d events to native datetimes (%d unparseable values left)", converted, skipped)
+
+
+@migration(6, "events: {start_time, end_time} for calendar window queries")
+async def events_calendar_index(db):
+    await db.events.create_indexes([
+        IndexModel([("start_time", ASCENDING), ("end_time", ASCENDING)], name="start_time_end_time"),
+    ])
+
+
+@migration(7, "events: text index over title and description for search")
+async def events_text_index(db):
+    await db.events.create_indexes([
+        IndexModel(
+            [("title", TEXT), ("description", TEXT)],
+            name="title_description_text",
+            weights={"title": 5, "description": 1},
+            default_language="english",
+        ),
+    ])
+
+
+@migration(8, "event_stats: seed dashboard counters from existing events")
+async def event_stats_seed(db):
+    corrected = await EventStatsRepository(db).reconcile()
+    logging.info("Seeded %d event stats counters", corrected)
+
+
+@migration(9, "events: {status, end_time} for the auto-archive scheduler")
+async def events_status_end_time_index(db):
+    await db.events.create_indexes([
+        IndexModel([("status", ASCENDING), ("end_time", ASCENDING)], name="status_end_time"),
+    ])
+
+
+@migration(10, "event_stats: carry the events generation over from collection_meta")
+async def events_generation_to_stats(db):
+    # Keeps list ETags monotonic; a restarted counter could repeat old values
+    meta = await db.collection_meta.find_one({"_id": "events"})
+    if meta:
+        await db.event_stats.update_one(
+            {"_id": "generation"},
+            {"$max": {"generation": meta.get("generation", 0)}, "$set": {"updated_at": meta.get("updated_at")}},
+            upsert=True,
+        )
+        await db.collection_meta.delete_one({"_id": "events"})
+
+
+@migration(11, "users: partial index on revoked token_version for the revocation map refresh")
+async def users_token_version_index(db):
+    await db.users.create_indexes([
+        IndexModel(
+            [("token_version", ASCENDING)],
+            name="token_version_revoked",
+            partialFilterExpression={"token_version": {"$gt": 0}},
+        ),
+    ])
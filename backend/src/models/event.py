@@ -1,6 +1,93 @@
-from datetime import datetime
-from typing import Optional, Union
+from datetime import datetime, timedelta, timezone
+from typing import List, Literal, Optional, Union
 from bson import ObjectId
+from pydantic import BaseModel, Field, model_validator
+
+# Longest allowed event; calendar queries rely on it to bound their index scan
+MAX_EVENT_DURATION = timedelta(days=31)
+
+
+def check_duration(start_time: datetime, end_time: datetime) -> None:
+    if end_time < start_time:
+        raise ValueError("end_time must not be before start_time")
+    if end_time - start_time > MAX_EVENT_DURATION:
+        raise ValueError(f"Events may last at most {MAX_EVENT_DURATION.days} days")
+
+
+def duration_filter(updates: dict) -> dict:
+    """
+    Filter conditions keeping an event within MAX_EVENT_DURATION when only one
+    of start_time/end_time is updated (the other is whatever is stored)
+    """
+    if "start_time" in updates and "end_time" not in updates:
+        start = updates["start_time"]
+        return {"end_time": {"$gte": start, "$lte": start + MAX_EVENT_DURATION}}
+    if "end_time" in updates and "start_time" not in updates:
+        end = updates["end_time"]
+        return {"start_time": {"$gte": end - MAX_EVENT_DURATION, "$lte": end}}
+    return {}
+
+# Pydantic schemas for API requests
+class EventCreateRequest(BaseModel):
+    title: str
+    description: str = ""
+    start_time: datetime
+    end_time: datetime
+
+    @model_validator(mode="after")
+    def _check_duration(self):
+        check_duration(self.start_time, self.end_time)
+        return self
+
+class EventUpdateRequest(BaseModel):
+    title: Optional[str] = None
+    description: Optional[str] = None
+    start_time: Optional[datetime] = None
+    end_time: Optional[datetime] = None
+
+    @model_validator(mode="after")
+    def _check_duration(self):
+        # Omitted means unchanged; an event cannot be left without a start or end
+        for field in ("start_time", "end_time"):
+            if field in self.model_fields_set and getattr(self, field) is None:
+                raise ValueError(f"{field} cannot be null")
+        # With only one of the two, the stored value is checked in the write filter
+        if self.start_time is not None and self.end_time is not None:
+            check_duration(self.start_time, self.end_time)
+        return self
+
+class BulkEventOperation(BaseModel):
+    op: Literal["create", "update", "approve", "archive", "delete"]
+    id: Optional[str] = None
+    # EventCreateRequest fields for create, EventUpdateRequest fields for update
+    data: Optional[dict] = None
+
+class BulkEventRequest(BaseModel):
+    operations: List[BulkEventOperation] = Field(..., min_length=1, max_length=500)
+
+EVENT_STATUSES = ("draft", "approved", "archived")
+
+# Stored as native BSON datetimes (naive UTC), not ISO strings
+EVENT_DATETIME_FIELDS = ("start_time", "end_time", "created_at", "updated_at", "archived_at")
+
+
+def to_utc_naive(value: datetime) -> datetime:
+    """Normalise a datetime to the naive UTC, millisecond form MongoDB hands back"""
+    if value.tzinfo is not None:
+        value = value.astimezone(timezone.utc).replace(tzinfo=None)
+    return value.replace(microsecond=value.microsecond // 1000 * 1000)
+
+# Event status state machine: target status -> statuses it may be entered from
+EVENT_TRANSITIONS = {
+    "approved": ("draft",),
+    "archived": ("draft", "approved"),
+}
+
+
+def allowed_sources(target: str) -> tuple:
+    """Statuses from which an event may move to `target`"""
+    return EVENT_TRANSITIONS.get(target, ())
+
 
 class Event:
     def __init__(
@@ -0,0 +1,4 @@
+# This file makes the repositories directory a Python package
+from repositories.users import UserRepository
+from repositories.events import EventRepository
+from repositories.event_stats import EventStatsRepository
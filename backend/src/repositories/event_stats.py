@@ -0,0 +1,127 @@
+from collections import Counter
+from datetime import datetime
+from typing import Iterable, List, Optional, Tuple
+from pymongo import UpdateOne
+
+# Counter documents in `event_stats`: {_id: "<kind>:<key>", count}, plus {_id: "total"}
+STAT_GROUPS = {"status": "by_status", "organizer": "by_organizer", "month": "by_month"}
+# Event fields the counters are derived from
+STAT_FIELDS = {"status": 1, "organizer_id": 1, "start_time": 1}
+# Collection-level version of `events` ({_id, generation, updated_at}), bumped
+# by every event write in the same bulk_write as the counter delta
+GENERATION_ID = "generation"
+
+
+def _month(value) -> Optional[str]:
+    if isinstance(value, datetime):
+        return value.strftime("%Y-%m")
+    if isinstance(value, str) and len(value) >= 7:
+        return value[:7]
+    return None
+
+
+def counter_keys(event: Optional[dict]) -> List[str]:
+    """Counters an event contributes 1 to (none for a missing event)"""
+    if not event:
+        return []
+    keys = ["total"]
+    if event.get("status"):
+        keys.append(f"status:{event['status']}")
+    if event.get("organizer_id") is not None:
+        keys.append(f"organizer:{event['organizer_id']}")
+    month = _month(event.get("start_time"))
+    if month:
+        keys.append(f"month:{month}")
+    return keys
+
+
+def counter_delta(changes: Iterable[Tuple[Optional[dict], Optional[dict]]]) -> Counter:
+    """Net counter changes for a series of (before, after) event images"""
+    delta = Counter()
+    for before, after in changes:
+        delta.update(counter_keys(after))
+        delta.subtract(counter_keys(before))
+    return delta
+
+
+class EventStatsRepository:
+    """
+    Incrementally maintained event counters (per status, organizer and
+    start month). EventRepository applies a delta after each write; the
+    periodic reconcile() recomputes them with $group and repairs any drift
+    (e.g. from a process dying between the event write and the $inc).
+    """
+
+    def __init__(self, db):
+        self.collection = db.event_stats
+        self.events = db.events
+        self.meta = db.collection_meta
+
+    async def apply(self, delta: Counter, bump_generation: bool = False) -> None:
+        """Apply a counter delta (and optionally bump the events generation) in one round trip"""
+        ops = [UpdateOne({"_id": key}, {"$inc": {"count": n}}, upsert=True) for key, n in delta.items() if n]
+        if bump_generation:
+            ops.append(UpdateOne(
+                {"_id": GENERATION_ID},
+                {"$inc": {"generation": 1}, "$set": {"updated_at": datetime.utcnow()}},
+                upsert=True,
+            ))
+        if ops:
+            await self.collection.bulk_write(ops, ordered=False)
+
+    async def get_generation(self) -> dict:
+        meta = await self.collection.find_one({"_id": GENERATION_ID})
+        return meta or {"_id": GENERATION_ID, "generation": 0, "updated_at": None}
+
+    async def snapshot(self) -> dict:
+        stats = {"total": 0, **{group: {} for group in STAT_GROUPS.values()}}
+        async for doc in self.collection.find({"count": {"$gt": 0}}):
+            if doc["_id"] == "total":
+                stats["total"] = doc["count"]
+                continue
+            kind, key = doc["_id"].split(":", 1)
+            if kind in STAT_GROUPS:
+                stats[STAT_GROUPS[kind]][key] = doc["count"]
+        meta = await self.meta.find_one({"_id": "event_stats"})
+        stats["reconciled_at"] = meta.get("reconciled_at") if meta else None
+        return stats
+
+    async def _aggregate(self) -> Counter:
+        month = {"$cond": [
+            {"$eq": [{"$type": "$start_time"}, "date"]},
+            {"$dateToString": {"format": "%Y-%m", "date": "$start_time"}},
+            {"$substrCP": [{"$ifNull": ["$start_time", ""]}, 0, 7]},
+        ]}
+        pipeline = [{"$facet": {
+            "total": [{"$count": "count"}],
+            "status": [{"$group": {"_id": "$status", "count": {"$sum": 1}}}],
+            "organizer": [{"$group": {"_id": {"$toString": "$organizer_id"}, "count": {"$sum": 1}}}],
+            "month": [{"$group": {"_id": month, "count": {"$sum": 1}}}],
+        }}]
+        facets = (await self.events.aggregate(pipeline).to_list(length=1))[0]
+        expected = Counter()
+        if facets["total"]:
+            expected["total"] = facets["total"][0]["count"]
+        for kind in STAT_GROUPS:
+            for row in facets[kind]:
+                if row["_id"]:
+                    expected[f"{kind}:{row['_id']}"] = row["count"]
+        return expected
+
+    async def reconcile(self) -> int:
+        """Overwrite the counters with a fresh $group over events; returns how many were wrong"""
+        expected = await self._aggregate()
+        current = {doc["_id"]: doc.get("count", 0) async for doc in self.collection.find({"_id": {"$ne": GENERATION_ID}})}
+        ops = [
+            UpdateOne({"_id": key}, {"$set": {"count": expected.get(key, 0)}}, upsert=True)
+            for key in set(expected) | set(current)
+            if expected.get(key, 0) != current.get(key, 0)
+        ]
+        if ops:
+            await self.collection.bulk_write(ops, ordered=False)
+        await self.meta.update_one(
+            {"_id": "event_stats"},
+            {"$set": {"reconciled_at": datetime.utcnow(), "corrected": len(ops)}},
+            upsert=True,
+        )
+        return len(ops)
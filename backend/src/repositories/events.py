@@ -0,0 +1,259 @@
+from datetime import datetime
+from typing import Any, AsyncIterator, Iterable, List, Optional, Tuple, Union
+from bson import ObjectId
+from pymongo import ReturnDocument
+from utils_dir.pagination import keyset_filter
+from models.event import MAX_EVENT_DURATION, allowed_sources, duration_filter, to_utc_naive
+from services.event_cache import invalidate_events
+from repositories.event_stats import STAT_FIELDS, EventStatsRepository, counter_delta
+
+
+def _oid(value: Union[str, ObjectId]) -> ObjectId:
+    return ObjectId(value) if isinstance(value, str) else value
+
+
+def _files_lookup(pipeline: list, as_field: str) -> list:
+    """
+    Stage joining each event's documents from `files` (models.file.File,
+    event_id is the event's ObjectId) into `as_field`, running `pipeline` on
+    them; the equality join is served by the {event_id, uploaded_at} index.
+    """
+    return [{"$lookup": {
+        "from": "files",
+        "localField": "_id",
+        "foreignField": "event_id",
+        "pipeline": pipeline,
+        "as": as_field,
+    }}]
+
+
+class EventRepository:
+    """Async data access for the events collection"""
+
+    def __init__(self, db):
+        self.collection = db.events
+        self.stats = EventStatsRepository(db)
+
+    async def find_page(
+        self,
+        query: dict,
+        limit: int,
+        direction: int = 1,
+        after: Optional[Tuple[Any, ObjectId]] = None,
+        projection: Optional[dict] = None,
+        files_summary: bool = False,
+    ) -> List[dict]:
+        """
+        One page ordered by (start_time, _id), served from the
+        {start_time, _id} / {status, start_time, _id} indexes. `after` is the
+        (start_time, _id) of the last item on the previous page. With
+        `files_summary` each event also gets `file_count` and `files_total_size`.
+        """
+        if after is not None:
+            query = {"$and": [query, keyset_filter("start_time", after[0], after[1], direction)]}
+        sort = [("start_time", direction), ("_id", direction)]
+        if files_summary:
+            # Same index-backed scan, then one $lookup for just this page's events
+            pipeline = [{"$match": query}, {"$sort": dict(sort)}, {"$limit": limit}]
+            if projection:
+                pipeline.append({"$project": projection})
+            pipeline += _files_lookup([
+                {"$group": {"_id": None, "count": {"$sum": 1}, "size": {"$sum": "$size"}}},
+            ], "_files_summary")
+            pipeline.append({"$set": {
+                "file_count": {"$ifNull": [{"$arrayElemAt": ["$_files_summary.count", 0]}, 0]},
+                "files_total_size": {"$ifNull": [{"$arrayElemAt": ["$_files_summary.size", 0]}, 0]},
+            }})
+            pipeline.append({"$unset": "_files_summary"})
+            return await self.collection.aggregate(pipeline).to_list(length=limit)
+        cursor = self.collection.find(query, projection).sort(sort).limit(limit)
+        return await cursor.to_list(length=limit)
+
+    async def iter_all(self, query: dict, batch_size: int = 500) -> AsyncIterator[dict]:
+        """Stream matching events in (start_time, _id) order, `batch_size` documents per round trip"""
+        cursor = self.collection.find(query).sort([("start_time", 1), ("_id", 1)]).batch_size(batch_size)
+        async for event in cursor:
+            yield event
+
+    async def search(
+        self,
+        text: str,
+        limit: int,
+        status: Optional[str] = None,
+        after: Optional[Tuple[float, ObjectId]] = None,
+        projection: Optional[dict] = None,
+    ) -> List[dict]:
+        """
+        One page of $text matches over title/description ordered by relevance
+        (textScore desc, _id desc), with the score returned as `score`.
+        `after` is the (score, _id) of the last item on the previous page.
+        """
+        match = {"$text": {"$search": text}}
+        if status:
+            match["status"] = status
+        pipeline = [
+            {"$match": match},
+            {"$addFields": {"score": {"$meta": "textScore"}}},
+        ]
+        if after is not None:
+            pipeline.append({"$match": keyset_filter("score", after[0], after[1], -1)})
+        pipeline += [
+            {"$sort": {"score": -1, "_id": -1}},
+            {"$limit": limit},
+        ]
+        if projection:
+            pipeline.append({"$project": {**projection, "score": 1}})
+        return await self.collection.aggregate(pipeline).to_list(length=limit)
+
+    async def find_in_window(
+        self,
+        start: datetime,
+        end: datetime,
+        status: Optional[str] = None,
+        projection: Optional[dict] = None,
+        limit: int = 0,
+    ) -> List[dict]:
+        """
+        Events overlapping [start, end), ordered by start_time. Served from the
+        {start_time, end_time} index: no event lasts longer than
+        MAX_EVENT_DURATION, so the start_time range scan is bounded on both
+        sides, and end_time is checked on the index keys.
+        """
+        query = {
+            "start_time": {"$gte": start - MAX_EVENT_DURATION, "$lt": end},
+            "end_time": {"$gt": start},
+        }
+        if status:
+            query["status"] = status
+        cursor = self.collection.find(query, projection).sort([("start_time", 1), ("end_time", 1)])
+        if limit:
+            cursor = cursor.limit(limit)
+        return await cursor.to_list(length=None)
+
+    async def find_by_id(self, event_id: Union[str, ObjectId]) -> Optional[dict]:
+        return await self.collection.find_one({"_id": _oid(event_id)})
+
+    async def find_by_id_with_files(self, event_id: Union[str, ObjectId]) -> Optional[dict]:
+        """
+        An event with its files (oldest first, without storage keys) plus
+        `file_count` and `files_total_size`, in a single aggregation.
+        """
+        pipeline = [{"$match": {"_id": _oid(event_id)}}]
+        pipeline += _files_lookup([
+            {"$sort": {"uploaded_at": 1}},
+            {"$project": {"storage_key": 0}},
+        ], "files")
+        pipeline.append({"$set": {
+            "file_count": {"$size": "$files"},
+            "files_total_size": {"$sum": "$files.size"},
+        }})
+        events = await self.collection.aggregate(pipeline).to_list(length=1)
+        return events[0] if events else None
+
+    async def get_generation(self) -> dict:
+        """Collection-level version, bumped by every write; used for list ETags"""
+        return await self.stats.get_generation()
+
+    async def record_writes(self, changes: Iterable[Tuple[Optional[dict], Optional[dict]]]) -> None:
+        """
+        Bookkeeping after event writes, given their (before, after) images:
+        the stats counter delta and the generation bump go out as one
+        bulk_write, and the response cache is dropped. Every write path ends here.
+        """
+        invalidate_events()
+        await self.stats.apply(counter_delta(changes), bump_generation=True)
+
+    async def insert(self, event_doc: dict) -> ObjectId:
+        result = await self.collection.insert_one(event_doc)
+        await self.record_writes([(None, event_doc)])
+        return result.inserted_id
+
+    async def _find_one_and_set(self, query: dict, updates: dict) -> Optional[dict]:
+        # The pre-image feeds the stats counters; with a plain $set the
+        # post-image is just the pre-image with `updates` applied
+        before = await self.collection.find_one_and_update(
+            query, {"$set": updates}, return_document=ReturnDocument.BEFORE
+        )
+        if before is None:
+            return None
+        # Match what the server stored (millisecond datetimes), so ETags built
+        # from this image agree with later reads
+        event = {**before, **{k: to_utc_naive(v) if isinstance(v, datetime) else v for k, v in updates.items()}}
+        await self.record_writes([(before, event)])
+        return event
+
+    async def update_fields(
+        self,
+        event_id: Union[str, ObjectId],
+        updates: dict,
+        organizer_id: Optional[str] = None,
+        expected_updated_at: Any = None,
+    ) -> Optional[dict]:
+        """
+        Atomically update an event and return the post-image, or None if no
+        event matched. `organizer_id` restricts the write to that organizer's
+        events; `expected_updated_at` makes it conditional on the version read.
+        A single new start_time/end_time must keep the stored counterpart
+        within MAX_EVENT_DURATION.
+        """
+        query = {"_id": _oid(event_id), **duration_filter(updates)}
+        if organizer_id is not None:
+            # organizer_id has been stored both as a string and as an ObjectId
+            query["organizer_id"] = {"$in": [organizer_id, _oid(organizer_id)]}
+        if expected_updated_at is not None:
+            query["updated_at"] = expected_updated_at
+        return await self._find_one_and_set(query, updates)
+
+    async def transition(self, event_id: Union[str, ObjectId], target: str, updates: dict) -> Optional[dict]:
+        """
+        Move an event to `target` status in one round trip, only if its current
+        status allows it (see models.event.EVENT_TRANSITIONS). Returns the
+        post-image, or None if the event is missing or in the wrong state.
+        """
+        query = {"_id": _oid(event_id), "status": {"$in": list(allowed_sources(target))}}
+        return await self._find_one_and_set(query, {**updates, "status": target})
+
+    async def archive_ended(self, now: datetime, limit: int) -> List[dict]:
+        """
+        Archive up to `limit` events whose end_time is before `now` with one
+        update_many over the {status, end_time} index. Returns the pre-images
+        (_id, status, organizer_id, start_time) of the events this call archived.
+        """
+        sources = list(allowed_sources("archived"))
+        candidates = await self.collection.find(
+            {"status": {"$in": sources}, "end_time": {"$lt": now}}, STAT_FIELDS
+        ).sort("end_time", 1).limit(limit).to_list(length=limit)
+        if not candidates:
+            return []
+        stamp = to_utc_naive(now)
+        ids = [e["_id"] for e in candidates]
+        result = await self.collection.update_many(
+            {"_id": {"$in": ids}, "status": {"$in": sources}},
+            {"$set": {"status": "archived", "archived_at": stamp, "updated_at": stamp}},
+        )
+        if result.modified_count < len(candidates):
+            # Some candidates were changed concurrently; only those carrying
+            # this batch's stamp were archived here
+            ours = {e["_id"] for e in await self.find_by_ids(ids, {"archived_at": 1}) if e.get("archived_at") == stamp}
+            candidates = [e for e in candidates if e["_id"] in ours]
+        if candidates:
+            await self.record_writes((e, {**e, "status": "archived"}) for e in candidates)
+        return candidates
+
+    async def find_by_ids(self, event_ids: List[ObjectId], projection: Optional[dict] = None) -> List[dict]:
+        return await self.collection.find({"_id": {"$in": event_ids}}, projection).to_list(length=None)
+
+    async def bulk_write(self, requests: list):
+        """
+        Execute write models (InsertOne/UpdateOne/DeleteOne) as one unordered
+        batch. No bookkeeping happens here: the caller knows which writes
+        succeeded and passes their images to `record_writes`.
+        """
+        return await self.collection.bulk_write(requests, ordered=False)
+
+    async def delete(self, event_id: Union[str, ObjectId]) -> int:
+        before = await self.collection.find_one_and_delete({"_id": _oid(event_id)}, projection=STAT_FIELDS)
+        if before is None:
+            return 0
+        await self.record_writes([(before, None)])
+        return 1
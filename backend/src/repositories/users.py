@@ -0,0 +1,61 @@
+from typing import List, Optional, Union
+from bson import ObjectId
+from pymongo import ReturnDocument
+
+
+def _oid(value: Union[str, ObjectId]) -> ObjectId:
+    return ObjectId(value) if isinstance(value, str) else value
+
+
+class UserRepository:
+    """Async data access for the users collection"""
+
+    def __init__(self, db):
+        self.collection = db.users
+
+    async def find_by_id(self, user_id: Union[str, ObjectId], projection: Optional[dict] = None) -> Optional[dict]:
+        return await self.collection.find_one({"_id": _oid(user_id)}, projection)
+
+    async def find_by_email(self, email: str) -> Optional[dict]:
+        return await self.collection.find_one({"email": email})
+
+    async def find_by_google_sub_or_email(self, google_sub: str, email: str) -> Optional[dict]:
+        return await self.collection.find_one({
+            "$or": [
+                {"google_sub": google_sub},
+                {"email": email}
+            ]
+        })
+
+    async def email_taken(self, email: str, exclude_user_id: Union[str, ObjectId]) -> bool:
+        existing = await self.collection.find_one(
+            {"email": email, "_id": {"$ne": _oid(exclude_user_id)}},
+            {"_id": 1}
+        )
+        return existing is not None
+
+    async def insert(self, user_doc: dict) -> ObjectId:
+        result = await self.collection.insert_one(user_doc)
+        return result.inserted_id
+
+    async def update(self, user_id: Union[str, ObjectId], updates: dict) -> None:
+        await self.collection.update_one({"_id": _oid(user_id)}, {"$set": updates})
+
+    async def update_and_get(self, user_id: Union[str, ObjectId], updates: dict) -> Optional[dict]:
+        """Apply $set updates and return the post-update document"""
+        return await self.collection.find_one_and_update(
+            {"_id": _oid(user_id)},
+            {"$set": updates},
+            return_document=ReturnDocument.AFTER
+        )
+
+    async def list_all(self) -> List[dict]:
+        return await self.collection.find({}, {"password": 0}).to_list(length=None)
+
+    async def set_role(self, user_id: Union[str, ObjectId], role: str) -> Optional[dict]:
+        """Change a user's role and bump token_version so tokens carrying the old role are revoked"""
+        return await self.collection.find_one_and_update(
+            {"_id": _oid(user_id)},
+            {"$set": {"role": role}, "$inc": {"token_version": 1}},
+            return_document=ReturnDocument.AFTER
+        )
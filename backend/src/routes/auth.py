@@ -1,9 +1,17 @@
-from fastapi import APIRouter, Request, Depends, Query, HTTPException, status
+from fastapi import APIRouter, BackgroundTasks, Request, Depends, Query, HTTPException, status
 from typing import Optional
 from controllers.auth_controller import AuthController
-from dependencies import get_current_user
+from dependencies import get_current_user, get_auth_controller
 from models.user import AuthResponse, AuthUrlResponse, UserResponse, MessageResponse
 from pydantic import BaseModel, EmailStr
+from services.rate_limiter import (
+    RateLimitExceeded,
+    login_ip_limiter,
+    login_email_limiter,
+    register_ip_limiter,
+    register_email_limiter,
+)
+import math
 import os
 
 router = APIRouter(prefix="/auth", tags=["Authentication"])
@@ -22,8 +30,25 @@ class UpdateProfileRequest(BaseModel):
     email: Optional[EmailStr] = None
     picture: Optional[str] = None
 
+async def enforce_rate_limits(request: Request, email: str, ip_limiter, email_limiter):
+    """Reject with 429 before any hashing or DB work if the client IP or email is over its budget"""
+    client_ip = request.client.host if request.client else "unknown"
+    try:
+        await ip_limiter.check(client_ip)
+        await email_limiter.check(email.lower())
+    except RateLimitExceeded as e:
+        raise HTTPException(
+            status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+            detail="Too many attempts, please try again later",
+            headers={"Retry-After": str(math.ceil(e.retry_after))},
+        )
+
 @router.get("/login")
-async def google_login(request: Request, redirect_uri: str = Query(None)):
+async def google_login(
+    request: Request,
+    redirect_uri: str = Query(None),
+    controller: AuthController = Depends(get_auth_controller)
+):
     """
     Initiate Google OAuth2 login and return Google OAuth URL
     
@@ -33,7 +58,6 @@ async def google_login(request: Request, redirect_uri: str = Query(None)):
     redirect_uri = redirect_uri or os.getenv("GOOGLE_REDIRECT_URI")
     if not redirect_uri:
         raise HTTPException(status_code=500, detail="GOOGLE_REDIRECT_URI is not set in the environment.")
-    controller = AuthController()
     auth_url = await controller.google_login_url(request, redirect_uri)
     return {"auth_url": auth_url}
 
@@ -41,7 +65,8 @@ async def google_login(request: Request, redirect_uri: str = Query(None)):
 async def google_callback(
     request: Request,
     code: Optional[str] = Query(None),
-    state: Optional[str] = Query(None)
+    state: Optional[str] = Query(None),
+    controller: AuthController = Depends(get_auth_controller)
 ):
     """
     Handle Google OAuth2 callback (internal endpoint)
@@ -49,19 +74,23 @@ async def google_callback(
     Google redirects here after authentication.
     This endpoint creates a JWT token and redirects to the frontend.
     """
-    controller = AuthController()
     return await controller.handle_google_callback(code, state, request)
 
 @router.get("/me", response_model=UserResponse)
-async def get_profile(current_user: dict = Depends(get_current_user)):
+async def get_profile(
+    current_user: dict = Depends(get_current_user),
+    controller: AuthController = Depends(get_auth_controller)
+):
     """Get current user profile"""
-    controller = AuthController()
     return await controller.get_user_profile(current_user)
 
 @router.patch("/me", response_model=UserResponse)
-async def update_profile(data: UpdateProfileRequest, current_user: dict = Depends(get_current_user)):
+async def update_profile(
+    data: UpdateProfileRequest,
+    current_user: dict = Depends(get_current_user),
+    controller: AuthController = Depends(get_auth_controller)
+):
     """Update current user's profile (name/email/picture)"""
-    controller = AuthController()
     return await controller.update_user_profile(current_user, data)
 
 @router.post("/logout", response_model=MessageResponse)
@@ -70,13 +99,22 @@ async def logout():
     return {"message": "Logged out successfully. Please delete your token."}
 
 @router.post("/register", response_model=UserResponse)
-async def register_user(data: RegisterRequest):
+async def register_user(
+    data: RegisterRequest,
+    request: Request,
+    controller: AuthController = Depends(get_auth_controller)
+):
     """Register a new user with name, email, password"""
-    controller = AuthController()
+    await enforce_rate_limits(request, data.email, register_ip_limiter, register_email_limiter)
     return await controller.register_user(data)
 
 @router.post("/password-login", response_model=AuthResponse)
-async def password_login(data: LoginRequest):
+async def password_login(
+    data: LoginRequest,
+    request: Request,
+    background_tasks: BackgroundTasks,
+    controller: AuthController = Depends(get_auth_controller)
+):
     """Login with email and password"""
-    controller = AuthController()
-    return await controller.password_login(data)
\ No newline at end of file
+    await enforce_rate_limits(request, data.email, login_ip_limiter, login_email_limiter)
+    return await controller.password_login(data, background_tasks)
\ No newline at end of file
@@ -1,115 +1,477 @@
-from fastapi import APIRouter, Depends, HTTPException, status, Query
-from dependencies import get_current_user
-from controllers.event_controller import create_event_controller
-from pydantic import BaseModel
-from datetime import datetime
-from typing import Optional, List
-from config.db import get_db_connection
+from fastapi import APIRouter, Depends, Header, HTTPException, status, Query, Request, Response
+from fastapi.responses import StreamingResponse
+from dependencies import get_current_user, get_event_repository, get_event_read_repository, get_stream_user_id
+from config.jwt_config import STREAM_TOKEN_TTL_SECONDS, create_stream_token
+from controllers.event_controller import create_event_controller, bulk_events_controller
+from models.event import EventCreateRequest, EventUpdateRequest, BulkEventRequest, check_duration, to_utc_naive
+import asyncio
+import csv
+import io
+import json
+import os
+from datetime import datetime, timedelta
+from typing import AsyncIterator, Optional, List
 from bson import ObjectId
+from repositories import EventRepository
+from utils_dir.pagination import InvalidCursor, decode_cursor, encode_cursor
+from services.event_stream import event_hub
+from services.event_cache import cache_bypassed, cache_generation, cache_response, get_cached_response
+from utils_dir.http_cache import etag_matches, event_etag, http_date, is_not_modified, make_etag
 
 router = APIRouter(prefix="/events", tags=["Events"])
 
-class EventCreateRequest(BaseModel):
-    title: str
-    description: str = ""
-    start_time: datetime
-    end_time: datetime
-
-class EventUpdateRequest(BaseModel):
-    title: Optional[str] = None
-    description: Optional[str] = None
-    start_time: Optional[datetime] = None
-    end_time: Optional[datetime] = None
+DEFAULT_PAGE_SIZE = 50
+MAX_PAGE_SIZE = 200
+# Fields selectable through ?fields= (_id is always returned)
+EVENT_FIELDS = {
+    "title", "description", "organizer_id", "start_time", "end_time",
+    "status", "created_at", "updated_at", "approved_by", "archived_at",
+}
+EXPORT_COLUMNS = [
+    "_id", "title", "description", "organizer_id", "start_time", "end_time",
+    "status", "created_at", "updated_at", "approved_by", "archived_at",
+]
+EXPORT_BATCH_SIZE = 500
+SEARCH_MAX_QUERY_LENGTH = 200
+CALENDAR_FIELDS = {"title": 1, "start_time": 1, "end_time": 1, "status": 1, "organizer_id": 1}
+CALENDAR_MAX_DAYS = 366
+CALENDAR_MAX_EVENTS = 2000
+# Rows are flushed to the client in chunks of roughly this size
+EXPORT_CHUNK_BYTES = 64 * 1024
+# Comment frames sent on idle streams so proxies keep the connection open
+STREAM_HEARTBEAT_SECONDS = float(os.getenv("EVENT_STREAM_HEARTBEAT_SECONDS", "15"))
 
 @router.post("/", status_code=201)
 async def create_event(request: EventCreateRequest, current_user: dict = Depends(get_current_user)):
     if current_user["role"] not in ["core_member", "admin"]:
         raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Insufficient permissions")
     event = await create_event_controller(request, current_user)
+    await event_hub.publish("created", event["_id"], event)
     return event
 
+# POST /events/bulk - many create/update/approve/archive/delete operations in one request
+@router.post("/bulk", response_model=dict)
+async def bulk_events(request: BulkEventRequest, current_user: dict = Depends(get_current_user)):
+    result = await bulk_events_controller(request.operations, current_user)
+    changes = {"create": "created", "update": "updated", "approve": "approved", "archive": "archived", "delete": "deleted"}
+    for item in result["results"]:
+        if item["ok"]:
+            await event_hub.publish(changes[item["op"]], item["id"])
+    return result
+
+def _from_cache(request: Request, response: Response, body, headers: dict, last_modified):
+    """Serve a cached list/detail body, still honouring conditional GET headers"""
+    if is_not_modified(request.headers, headers["ETag"], last_modified):
+        return Response(status_code=304, headers={**headers, "X-Cache": "HIT"})
+    response.headers.update(headers)
+    response.headers["X-Cache"] = "HIT"
+    return body
+
+def _link_next_page(request: Request, response: Response, next_cursor: str):
+    response.headers["X-Next-Cursor"] = next_cursor
+    next_url = request.url.include_query_params(cursor=next_cursor)
+    response.headers["Link"] = f'<{next_url}>; rel="next"'
+
 @router.get("/", response_model=List[dict])
-async def list_events(status: Optional[str] = Query(None, description="Filter by status"), current_user: dict = Depends(get_current_user)):
-    db = get_db_connection()
+async def list_events(
+    request: Request,
+    response: Response,
+    status: Optional[str] = Query(None, description="Filter by status"),
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE, description="Page size"),
+    cursor: Optional[str] = Query(None, description="Cursor from the previous page's X-Next-Cursor header"),
+    sort: str = Query("start_time", pattern="^-?start_time$", description="start_time or -start_time"),
+    fields: Optional[str] = Query(None, description="Comma-separated fields to return"),
+    include: Optional[str] = Query(None, pattern="^files_summary$", description="files_summary adds file_count and files_total_size"),
+    current_user: dict = Depends(get_current_user),
+    events_repo: EventRepository = Depends(get_event_read_repository)
+):
+    """
+    Keyset-paginated events ordered by (start_time, _id). The body stays a
+    JSON list; when more results exist the next page's cursor is returned in
+    the X-Next-Cursor header (and as a rel="next" Link).
+    """
+    cache_key = tuple(sorted(request.query_params.multi_items()))
+    generation = cache_generation()
+    # The events generation does not move when files change, so file totals
+    # are neither cached nor covered by an ETag
+    with_files = include == "files_summary"
+    bypass = with_files or cache_bypassed(request.headers)
+    cached = None if bypass else get_cached_response("list", generation, cache_key)
+    if cached is not None:
+        events, headers, last_modified = cached
+        return _from_cache(request, response, [dict(e) for e in events], headers, last_modified)
+    response.headers["X-Cache"] = "BYPASS" if bypass else "MISS"
+
+    meta = None
+    if not with_files:
+        # The list ETag is derived from the collection generation, so an unchanged
+        # collection is answered with 304 before any event is read
+        meta = await events_repo.get_generation()
+        etag = make_etag("events", meta["generation"], cache_key)
+        cache_headers = {"ETag": etag}
+        if meta.get("updated_at"):
+            cache_headers["Last-Modified"] = http_date(meta["updated_at"])
+        if is_not_modified(request.headers, etag, meta.get("updated_at")):
+            return Response(status_code=304, headers=cache_headers)
+        response.headers.update(cache_headers)
+
+    direction = -1 if sort.startswith("-") else 1
     query = {}
     if status:
         query["status"] = status
-    events = list(db.events.find(query))
+
+    after = None
+    if cursor:
+        try:
+            after = decode_cursor(cursor, direction)
+        except InvalidCursor as e:
+            raise HTTPException(status_code=400, detail=str(e))
+
+    projection = None
+    requested = None
+    if fields:
+        requested = {f.strip() for f in fields.split(",") if f.strip()}
+        unknown = requested - EVENT_FIELDS
+        if unknown:
+            raise HTTPException(status_code=400, detail=f"Unknown fields: {', '.join(sorted(unknown))}")
+        # start_time is always fetched because the cursor is built from it
+        projection = {f: 1 for f in requested | {"start_time"}}
+
+    # Fetch one extra row to learn whether another page exists
+    events = await events_repo.find_page(query, limit + 1, direction, after, projection, with_files)
+    if len(events) > limit:
+        events = events[:limit]
+        last = events[-1]
+        _link_next_page(request, response, encode_cursor(last.get("start_time"), last["_id"], direction))
+
+    for event in events:
+        event["_id"] = str(event["_id"])
+        if requested is not None and "start_time" not in requested:
+            event.pop("start_time", None)
+    if not with_files:
+        page_headers = {k: response.headers[k] for k in ("ETag", "Last-Modified", "X-Next-Cursor", "Link") if k in response.headers}
+        cache_response("list", generation, cache_key, ([dict(e) for e in events], page_headers, meta.get("updated_at")))
+    return events
+
+# GET /events/search - relevance-ranked text search over title and description
+@router.get("/search", response_model=List[dict])
+async def search_events(
+    request: Request,
+    response: Response,
+    q: str = Query(..., min_length=1, max_length=SEARCH_MAX_QUERY_LENGTH, description="Search terms; quote phrases, prefix - to exclude"),
+    status: Optional[str] = Query(None, description="Filter by status"),
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE, description="Page size"),
+    cursor: Optional[str] = Query(None, description="Cursor from the previous page's X-Next-Cursor header"),
+    current_user: dict = Depends(get_current_user),
+    events_repo: EventRepository = Depends(get_event_read_repository)
+):
+    """
+    Events matching `q`, best match first, each with its relevance `score`.
+    Paginated like GET /events/ through the X-Next-Cursor header.
+    """
+    after = None
+    if cursor:
+        try:
+            after = decode_cursor(cursor, -1)
+        except InvalidCursor as e:
+            raise HTTPException(status_code=400, detail=str(e))
+
+    events = await events_repo.search(q, limit + 1, status, after)
+    if len(events) > limit:
+        events = events[:limit]
+        last = events[-1]
+        _link_next_page(request, response, encode_cursor(last["score"], last["_id"], -1))
+    for event in events:
+        event["_id"] = str(event["_id"])
+    return events
+
+def _time_bound(value: datetime) -> datetime:
+    """Query value for comparing against stored start_time/end_time"""
+    return to_utc_naive(value)
+
+def _json_default(value):
+    return value.isoformat() if isinstance(value, datetime) else str(value)
+
+async def _export_ndjson(events: AsyncIterator[dict]) -> AsyncIterator[str]:
+    buffer = io.StringIO()
+    async for event in events:
+        event["_id"] = str(event["_id"])
+        buffer.write(json.dumps(event, default=_json_default) + "\n")
+        if buffer.tell() >= EXPORT_CHUNK_BYTES:
+            yield buffer.getvalue()
+            buffer.seek(0)
+            buffer.truncate()
+    yield buffer.getvalue()
+
+async def _export_csv(events: AsyncIterator[dict]) -> AsyncIterator[str]:
+    buffer = io.StringIO()
+    writer = csv.DictWriter(buffer, fieldnames=EXPORT_COLUMNS, extrasaction="ignore")
+    writer.writeheader()
+    async for event in events:
+        event["_id"] = str(event["_id"])
+        writer.writerow({
+            k: ("" if v is None else v.isoformat() if isinstance(v, datetime) else v)
+            for k, v in event.items()
+        })
+        if buffer.tell() >= EXPORT_CHUNK_BYTES:
+            yield buffer.getvalue()
+            buffer.seek(0)
+            buffer.truncate()
+    yield buffer.getvalue()
+
+# GET /events/export - Admin only; streams rows as they are read from the cursor
+@router.get("/export")
+async def export_events(
+    format: str = Query("ndjson", pattern="^(ndjson|csv)$", description="ndjson or csv"),
+    status: Optional[str] = Query(None, description="Filter by status"),
+    start_from: Optional[datetime] = Query(None, alias="from", description="Events starting at or after"),
+    start_to: Optional[datetime] = Query(None, alias="to", description="Events starting before"),
+    current_user: dict = Depends(get_current_user),
+    events_repo: EventRepository = Depends(get_event_read_repository)
+):
+    if current_user["role"] != "admin":
+        raise HTTPException(status_code=403, detail="Forbidden")
+    query = {}
+    if status:
+        query["status"] = status
+    if start_from or start_to:
+        query["start_time"] = {}
+        if start_from:
+            query["start_time"]["$gte"] = _time_bound(start_from)
+        if start_to:
+            query["start_time"]["$lt"] = _time_bound(start_to)
+
+    events = events_repo.iter_all(query, batch_size=EXPORT_BATCH_SIZE)
+    if format == "csv":
+        body, media_type = _export_csv(events), "text/csv"
+    else:
+        body, media_type = _export_ndjson(events), "application/x-ndjson"
+    return StreamingResponse(
+        body,
+        media_type=media_type,
+        headers={"Content-Disposition": f'attachment; filename="events.{format}"'},
+    )
+
+async def _event_stream(request: Request, subscription) -> AsyncIterator[str]:
+    try:
+        yield "retry: 5000\n\n"
+        while True:
+            try:
+                message = await asyncio.wait_for(subscription.queue.get(), STREAM_HEARTBEAT_SECONDS)
+            except asyncio.TimeoutError:
+                if await request.is_disconnected():
+                    break
+                yield ": heartbeat\n\n"
+                continue
+            if message is None:
+                break
+            yield event_hub.format(message)
+    finally:
+        event_hub.unsubscribe(subscription)
+
+# POST /events/stream/token - short-lived token for opening the stream with EventSource
+@router.post("/stream/token", response_model=dict)
+async def stream_token(current_user: dict = Depends(get_current_user)):
+    return {
+        "token": create_stream_token(str(current_user["_id"])),
+        "expires_in": STREAM_TOKEN_TTL_SECONDS,
+    }
+
+# GET /events/stream - Server-Sent Events: created/updated/approved/archived/deleted notifications.
+# Authenticate with ?token= from POST /events/stream/token, or a Bearer header
+@router.get("/stream")
+async def stream_events(request: Request, user_id: str = Depends(get_stream_user_id)):
+    subscription = event_hub.subscribe()
+    if subscription is None:
+        raise HTTPException(status_code=503, detail="Too many open event streams", headers={"Retry-After": "30"})
+    return StreamingResponse(
+        _event_stream(request, subscription),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+# GET /events/stats - Admin only; dashboard counters kept up to date by the write paths
+@router.get("/stats", response_model=dict)
+async def event_stats(current_user: dict = Depends(get_current_user), events_repo: EventRepository = Depends(get_event_read_repository)):
+    if current_user["role"] != "admin":
+        raise HTTPException(status_code=403, detail="Forbidden")
+    return await events_repo.stats.snapshot()
+
+# GET /events/calendar - events overlapping a time window, for calendar views
+@router.get("/calendar", response_model=List[dict])
+async def calendar_events(
+    response: Response,
+    window_from: datetime = Query(..., alias="from", description="Window start (inclusive)"),
+    window_to: datetime = Query(..., alias="to", description="Window end (exclusive)"),
+    status: Optional[str] = Query(None, description="Filter by status"),
+    current_user: dict = Depends(get_current_user),
+    events_repo: EventRepository = Depends(get_event_read_repository)
+):
+    start, end = _time_bound(window_from), _time_bound(window_to)
+    if end <= start:
+        raise HTTPException(status_code=400, detail="'to' must be after 'from'")
+    if end - start > timedelta(days=CALENDAR_MAX_DAYS):
+        raise HTTPException(status_code=400, detail=f"Window may span at most {CALENDAR_MAX_DAYS} days")
+    events = await events_repo.find_in_window(start, end, status, CALENDAR_FIELDS, CALENDAR_MAX_EVENTS + 1)
+    if len(events) > CALENDAR_MAX_EVENTS:
+        # Only the first CALENDAR_MAX_EVENTS by start_time are returned; ask for a narrower window
+        events = events[:CALENDAR_MAX_EVENTS]
+        response.headers["X-Result-Truncated"] = "true"
     for event in events:
         event["_id"] = str(event["_id"])
     return events
 
 @router.get("/{event_id}", response_model=dict)
-async def get_event(event_id: str, current_user: dict = Depends(get_current_user)):
-    db = get_db_connection()
-    event = db.events.find_one({"_id": ObjectId(event_id)})
+async def get_event(
+    event_id: str,
+    request: Request,
+    response: Response,
+    include: Optional[str] = Query(None, pattern="^files$", description="files embeds the event's files, file_count and files_total_size"),
+    current_user: dict = Depends(get_current_user),
+    events_repo: EventRepository = Depends(get_event_read_repository)
+):
+    with_files = include == "files"
+    cache_key = (event_id, include)
+    generation = cache_generation()
+    bypass = cache_bypassed(request.headers)
+    cached = None if bypass else get_cached_response("event", generation, cache_key)
+    if cached is not None:
+        event, headers = cached
+        last_modified = None if with_files else event.get("updated_at")
+        return _from_cache(request, response, dict(event), headers, last_modified)
+    response.headers["X-Cache"] = "BYPASS" if bypass else "MISS"
+
+    if with_files:
+        event = await events_repo.find_by_id_with_files(event_id)
+    else:
+        event = await events_repo.find_by_id(event_id)
     if not event:
         raise HTTPException(status_code=404, detail="Event not found")
+    if with_files:
+        # Uploads do not touch the event, so the validator also covers the file
+        # totals and Last-Modified is left out
+        etag = make_etag(event_etag(event), event["file_count"], event["files_total_size"])
+        last_modified = None
+        for f in event["files"]:
+            for key in ("_id", "event_id", "uploader_id"):
+                if isinstance(f.get(key), ObjectId):
+                    f[key] = str(f[key])
+    else:
+        etag = event_etag(event)
+        last_modified = event.get("updated_at")
+    cache_headers = {"ETag": etag}
+    if last_modified:
+        cache_headers["Last-Modified"] = http_date(last_modified)
     event["_id"] = str(event["_id"])
-    # TODO: Fetch related files if needed
+    cache_response("event", generation, cache_key, (dict(event), cache_headers))
+    if is_not_modified(request.headers, etag, last_modified):
+        return Response(status_code=304, headers=cache_headers)
+    response.headers.update(cache_headers)
     return event
 
-# PATCH /events/{id} - Organizer (if organizer_id matches) OR Admin
-@router.patch("/{event_id}", response_model=dict)
-async def update_event(event_id: str, update: EventUpdateRequest, current_user: dict = Depends(get_current_user)):
-    db = get_db_connection()
-    event = db.events.find_one({"_id": ObjectId(event_id)})
+async def _raise_write_failure(
+    events_repo: EventRepository,
+    event_id: str,
+    current_user: dict,
+    target: Optional[str] = None,
+    updates: Optional[dict] = None,
+):
+    """
+    Explain why a conditional write matched nothing. Only runs on the failure
+    path, so successful writes stay a single round trip.
+    """
+    event = await events_repo.find_by_id(event_id)
     if not event:
         raise HTTPException(status_code=404, detail="Event not found")
-    if current_user["role"] != "admin" and str(event["organizer_id"]) != str(current_user["_id"]):
-        raise HTTPException(status_code=403, detail="Forbidden")
-    update_data = {k: v for k, v in update.dict(exclude_unset=True).items()}
-    update_data["updated_at"] = datetime.utcnow().isoformat()
-    db.events.update_one({"_id": ObjectId(event_id)}, {"$set": update_data})
-    event.update(update_data)
+    if target is None:
+        if current_user["role"] != "admin" and str(event["organizer_id"]) != str(current_user["_id"]):
+            raise HTTPException(status_code=403, detail="Forbidden")
+        merged = {**event, **(updates or {})}
+        if isinstance(merged.get("start_time"), datetime) and isinstance(merged.get("end_time"), datetime):
+            try:
+                check_duration(merged["start_time"], merged["end_time"])
+            except ValueError as e:
+                raise HTTPException(status_code=422, detail=str(e))
+        raise HTTPException(status_code=412, detail="Event was modified; reload and retry")
+    raise HTTPException(
+        status_code=409,
+        detail=f"Cannot move event from '{event.get('status')}' to '{target}'"
+    )
+
+def _write_response(event: dict, response: Response) -> dict:
+    response.headers["ETag"] = event_etag(event)
     event["_id"] = str(event["_id"])
     return event
 
-# PATCH /events/{id}/approve - Admin only
+# PATCH /events/{id} - Organizer (if organizer_id matches) OR Admin
+@router.patch("/{event_id}", response_model=dict)
+async def update_event(
+    event_id: str,
+    update: EventUpdateRequest,
+    response: Response,
+    if_match: Optional[str] = Header(None, description="ETag from a previous GET; rejects the update with 412 if the event changed since"),
+    current_user: dict = Depends(get_current_user),
+    events_repo: EventRepository = Depends(get_event_repository)
+):
+    organizer_id = None if current_user["role"] == "admin" else str(current_user["_id"])
+    expected = None
+    if if_match:
+        # Optimistic concurrency needs the current version to put in the filter
+        current = await events_repo.find_by_id(event_id)
+        if not current:
+            raise HTTPException(status_code=404, detail="Event not found")
+        if not etag_matches(if_match, event_etag(current), strong=True):
+            raise HTTPException(status_code=412, detail="Event was modified; reload and retry")
+        expected = current.get("updated_at")
+
+    update_data = {
+        k: (to_utc_naive(v) if isinstance(v, datetime) else v)
+        for k, v in update.dict(exclude_unset=True).items()
+    }
+    update_data["updated_at"] = datetime.utcnow()
+    # Permission and version checks live in the filter: one round trip, no lost updates
+    event = await events_repo.update_fields(event_id, update_data, organizer_id, expected)
+    if event is None:
+        await _raise_write_failure(events_repo, event_id, current_user, updates=update_data)
+    await event_hub.publish("updated", event_id, event)
+    return _write_response(event, response)
+
+# PATCH /events/{id}/approve - Admin only; draft -> approved
 @router.patch("/{event_id}/approve", response_model=dict)
-async def approve_event(event_id: str, current_user: dict = Depends(get_current_user)):
+async def approve_event(event_id: str, response: Response, current_user: dict = Depends(get_current_user), events_repo: EventRepository = Depends(get_event_repository)):
     if current_user["role"] != "admin":
         raise HTTPException(status_code=403, detail="Forbidden")
-    db = get_db_connection()
-    event = db.events.find_one({"_id": ObjectId(event_id)})
-    if not event:
-        raise HTTPException(status_code=404, detail="Event not found")
-    update_data = {
-        "status": "approved",
+    event = await events_repo.transition(event_id, "approved", {
         "approved_by": str(current_user["_id"]),
-        "updated_at": datetime.utcnow().isoformat()
-    }
-    db.events.update_one({"_id": ObjectId(event_id)}, {"$set": update_data})
-    event.update(update_data)
-    event["_id"] = str(event["_id"])
-    return event
+        "updated_at": datetime.utcnow()
+    })
+    if event is None:
+        await _raise_write_failure(events_repo, event_id, current_user, "approved")
+    await event_hub.publish("approved", event_id, event)
+    return _write_response(event, response)
 
-# PATCH /events/{id}/archive - Core or Admin
+# PATCH /events/{id}/archive - Core or Admin; draft/approved -> archived
 @router.patch("/{event_id}/archive", response_model=dict)
-async def archive_event(event_id: str, current_user: dict = Depends(get_current_user)):
+async def archive_event(event_id: str, response: Response, current_user: dict = Depends(get_current_user), events_repo: EventRepository = Depends(get_event_repository)):
     if current_user["role"] not in ["core_member", "admin"]:
         raise HTTPException(status_code=403, detail="Forbidden")
-    db = get_db_connection()
-    event = db.events.find_one({"_id": ObjectId(event_id)})
-    if not event:
-        raise HTTPException(status_code=404, detail="Event not found")
-    update_data = {
-        "status": "archived",
-        "archived_at": datetime.utcnow().isoformat(),
-        "updated_at": datetime.utcnow().isoformat()
-    }
-    db.events.update_one({"_id": ObjectId(event_id)}, {"$set": update_data})
-    event.update(update_data)
-    event["_id"] = str(event["_id"])
-    return event
+    now = datetime.utcnow()
+    event = await events_repo.transition(event_id, "archived", {
+        "archived_at": now,
+        "updated_at": now
+    })
+    if event is None:
+        await _raise_write_failure(events_repo, event_id, current_user, "archived")
+    await event_hub.publish("archived", event_id, event)
+    return _write_response(event, response)
 
 # DELETE /events/{id} - Admin only
 @router.delete("/{event_id}", response_model=dict)
-async def delete_event(event_id: str, current_user: dict = Depends(get_current_user)):
+async def delete_event(event_id: str, current_user: dict = Depends(get_current_user), events_repo: EventRepository = Depends(get_event_repository)):
     if current_user["role"] != "admin":
         raise HTTPException(status_code=403, detail="Forbidden")
-    db = get_db_connection()
-    result = db.events.delete_one({"_id": ObjectId(event_id)})
-    if result.deleted_count == 0:
+    deleted = await events_repo.delete(event_id)
+    if deleted == 0:
         raise HTTPException(status_code=404, detail="Event not found")
+    await event_hub.publish("deleted", event_id)
     return {"message": "Event deleted successfully"}
\ No newline at end of file
@@ -15,14 +15,14 @@ class RoleUpdateRequest(BaseModel):
 @router.get("/", response_model=list)
 async def get_all_users_route(current_user: dict = Depends(get_current_user)):
     is_admin(current_user)
-    return get_all_users()
+    return await get_all_users()
 
 @router.patch("/{user_id}/role")
 async def update_user_role_route(user_id: str, data: RoleUpdateRequest = Body(...), current_user: dict = Depends(get_current_user)):
     is_admin(current_user)
     if data.role not in ["admin", "user", "core_member"]:
         raise HTTPException(status_code=400, detail="Invalid role")
-    result = update_user_role(user_id, data.role)
+    result = await update_user_role(user_id, data.role)
     if result == "admin_locked":
         raise HTTPException(status_code=403, detail="Cannot change role of admin user")
     if not result:
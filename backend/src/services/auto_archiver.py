@@ -0,0 +1,104 @@
+import logging
+import os
+import socket
+import time
+import uuid
+from datetime import datetime, timedelta
+from pymongo.errors import DuplicateKeyError
+from repositories import EventRepository
+from services.event_stream import event_hub
+
+LOCK_ID = "auto-archive"
+
+
+class AutoArchiver:
+    """
+    Archives events whose end_time has passed, `batch_size` at a time.
+    Every worker runs the schedule, but only the holder of the lease in
+    `scheduler_locks` does any work; the lease is renewed on each run and
+    taken over by another worker once it expires.
+    """
+
+    def __init__(self, batch_size: int, max_batches: int, lease_seconds: float):
+        self.batch_size = batch_size
+        self.max_batches = max_batches
+        self.lease_seconds = lease_seconds
+        self.owner = f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:8]}"
+        self.is_leader = False
+        self.runs = 0
+        self.batches = 0
+        self.archived = 0
+        self.last_batch_size = 0
+        self.last_batch_ms = 0.0
+        self.max_batch_ms = 0.0
+        self.last_run_at = None
+
+    async def _acquire(self, db) -> bool:
+        now = datetime.utcnow()
+        try:
+            await db.scheduler_locks.find_one_and_update(
+                {"_id": LOCK_ID, "$or": [{"owner": self.owner}, {"expires_at": {"$lt": now}}]},
+                {"$set": {"owner": self.owner, "expires_at": now + timedelta(seconds=self.lease_seconds)}},
+                upsert=True,
+            )
+        except DuplicateKeyError:
+            # Lock document exists and another worker's lease is still valid
+            self.is_leader = False
+            return False
+        self.is_leader = True
+        return True
+
+    async def release(self, db) -> None:
+        if self.is_leader:
+            await db.scheduler_locks.delete_one({"_id": LOCK_ID, "owner": self.owner})
+            self.is_leader = False
+
+    async def run(self, db) -> int:
+        """One scheduled pass; returns the number of events archived"""
+        if not await self._acquire(db):
+            return 0
+        self.runs += 1
+        self.last_run_at = datetime.utcnow()
+        events_repo = EventRepository(db)
+        archived = 0
+        for _ in range(self.max_batches):
+            started = time.perf_counter()
+            batch = await events_repo.archive_ended(datetime.utcnow(), self.batch_size)
+            elapsed_ms = (time.perf_counter() - started) * 1000
+            if not batch:
+                break
+            self.batches += 1
+            self.last_batch_size = len(batch)
+            self.last_batch_ms = round(elapsed_ms, 2)
+            self.max_batch_ms = max(self.max_batch_ms, self.last_batch_ms)
+            archived += len(batch)
+            for event in batch:
+                await event_hub.publish("archived", event["_id"])
+            if len(batch) < self.batch_size:
+                break
+        self.archived += archived
+        if archived:
+            logging.info("Auto-archived %d finished events", archived)
+        return archived
+
+    def stats(self) -> dict:
+        return {
+            "is_leader": self.is_leader,
+            "runs": self.runs,
+            "batches": self.batches,
+            "archived": self.archived,
+            "last_batch_size": self.last_batch_size,
+            "last_batch_ms": self.last_batch_ms,
+            "max_batch_ms": self.max_batch_ms,
+            "last_run_at": self.last_run_at.isoformat() if self.last_run_at else None,
+        }
+
+
+AUTO_ARCHIVE_INTERVAL_SECONDS = float(os.getenv("AUTO_ARCHIVE_INTERVAL_SECONDS", "300"))
+
+auto_archiver = AutoArchiver(
+    batch_size=int(os.getenv("AUTO_ARCHIVE_BATCH_SIZE", "500")),
+    max_batches=int(os.getenv("AUTO_ARCHIVE_MAX_BATCHES", "20")),
+    # Outlives one interval so the leader keeps the lock between runs
+    lease_seconds=float(os.getenv("AUTO_ARCHIVE_LOCK_SECONDS", str(max(AUTO_ARCHIVE_INTERVAL_SECONDS * 3, 60)))),
+)
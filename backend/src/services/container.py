@@ -0,0 +1,52 @@
+import logging
+import os
+from typing import List, Optional
+
+from config import jwt_config
+from config.db import get_db, get_read_db
+from controllers.auth_controller import AuthController
+from repositories import UserRepository
+from services.backblaze_service import BackblazeService
+from services.google_oauth import GoogleOAuthService
+
+_DEFAULT_JWT_SECRET = "your-super-secret-jwt-key-change-this-in-production"
+
+
+class ServiceContainer:
+    """
+    Application-scoped services, built once in the app lifespan and shared by
+    every request (see dependencies.get_auth_controller).
+    """
+
+    def __init__(self):
+        self.db = get_db()
+        self.read_db = get_read_db()
+        self.jwt = jwt_config
+        self.google_oauth: Optional[GoogleOAuthService] = None
+        try:
+            # Reads env vars / client_secret.json once instead of per request
+            self.google_oauth = GoogleOAuthService()
+        except ValueError as e:
+            logging.warning("Google OAuth disabled: %s", e)
+        self.storage = BackblazeService()
+        self.auth_controller = AuthController(UserRepository(self.db), self.google_oauth)
+
+    def validate(self) -> List[str]:
+        """
+        Check credentials at startup. Problems are logged; with
+        ENVIRONMENT=production a missing JWT_SECRET aborts startup instead.
+        Google OAuth and Backblaze B2 are optional and only ever warned about.
+        """
+        problems = []
+        if self.jwt.JWT_SECRET == _DEFAULT_JWT_SECRET:
+            problems.append("JWT_SECRET is not set; tokens are signed with the default secret")
+            if os.getenv("ENVIRONMENT", "development") == "production":
+                raise RuntimeError("Startup validation failed: " + problems[0])
+        if self.google_oauth is None:
+            problems.append("Google OAuth credentials missing; /auth/login and /auth/callback will return 503")
+        if not all([self.storage.account_id, self.storage.application_key, self.storage.bucket_name]):
+            problems.append("Backblaze B2 credentials (B2_ACCOUNT_ID, B2_APPLICATION_KEY, B2_BUCKET_NAME) incomplete")
+
+        for problem in problems:
+            logging.warning("Startup check: %s", problem)
+        return problems
@@ -0,0 +1,59 @@
+import os
+import time
+from typing import Any, Hashable, Optional
+from utils_dir.cache import TTLCache
+
+# Rendered GET /events/ and GET /events/{id} responses. Keys embed the local
+# generation, so every event write makes all earlier entries unreachable; they
+# then age out through the LRU/TTL bounds. Writes made by other workers are
+# only seen once EVENT_CACHE_TTL_SECONDS expires.
+event_cache = TTLCache(
+    maxsize=int(os.getenv("EVENT_CACHE_MAX_SIZE", "2000")),
+    ttl=float(os.getenv("EVENT_CACHE_TTL_SECONDS", "5")),
+)
+
+# Reads may go to a secondary that has not replicated this worker's latest
+# write yet; responses produced this soon after a write are served but not cached
+SETTLE_SECONDS = float(os.getenv("EVENT_CACHE_SETTLE_SECONDS", "2"))
+
+_generation = 0
+_invalidated_at = float("-inf")
+_skipped = 0
+
+
+def invalidate_events() -> None:
+    """Bump the cache generation; call after any write to the events collection"""
+    global _generation, _invalidated_at
+    _generation += 1
+    _invalidated_at = time.monotonic()
+
+
+def cache_generation() -> int:
+    """Generation to key a read by; take it before the read starts"""
+    return _generation
+
+
+def cache_bypassed(headers) -> bool:
+    """Clients opt out with `Cache-Control: no-cache` (or no-store)"""
+    directives = {d.strip().lower() for d in headers.get("cache-control", "").split(",")}
+    return bool(directives & {"no-cache", "no-store"})
+
+
+def get_cached_response(kind: str, generation: int, key: Hashable) -> Optional[Any]:
+    return event_cache.get((kind, generation, key))
+
+
+def cache_response(kind: str, generation: int, key: Hashable, value: Any) -> None:
+    """
+    Store a response under the generation taken when its read began, so a read
+    that overlapped a write is filed under the old, already unreachable key
+    """
+    global _skipped
+    if time.monotonic() - _invalidated_at < SETTLE_SECONDS:
+        _skipped += 1
+        return
+    event_cache.set((kind, generation, key), value)
+
+
+def event_cache_stats() -> dict:
+    return {**event_cache.stats(), "generation": _generation, "skipped_settling": _skipped}
@@ -0,0 +1,183 @@
+import asyncio
+import json
+import logging
+import os
+from abc import ABC, abstractmethod
+from datetime import datetime
+from typing import Callable, Optional, Set
+
+# Event fields carried in change notifications
+STREAM_FIELDS = ("title", "status", "organizer_id", "start_time", "end_time", "updated_at")
+
+
+class EventStreamBackend(ABC):
+    """
+    Transport between publishers and the hub's local subscribers. The
+    in-memory backend only reaches this worker; a shared backend (e.g. Redis
+    pub/sub) implements `publish` to fan out and calls the attached
+    `deliver` callback for messages from every worker.
+    """
+
+    def attach(self, deliver: Callable[[dict], None]) -> None:
+        self.deliver = deliver
+
+    async def start(self) -> None:
+        pass
+
+    async def stop(self) -> None:
+        pass
+
+    @abstractmethod
+    async def publish(self, message: dict) -> None:
+        """Send `message` to the hubs of all workers sharing this backend"""
+
+
+class InMemoryEventStreamBackend(EventStreamBackend):
+    async def publish(self, message: dict) -> None:
+        self.deliver(message)
+
+
+def _json_default(value):
+    return value.isoformat() if isinstance(value, datetime) else str(value)
+
+
+class Subscription:
+    def __init__(self, maxsize: int):
+        self.queue: asyncio.Queue = asyncio.Queue(maxsize=maxsize)
+
+    def offer(self, message: Optional[dict]) -> bool:
+        """Queue a message; a subscriber that has fallen behind gets its backlog replaced by a resync notice"""
+        try:
+            self.queue.put_nowait(message)
+            return True
+        except asyncio.QueueFull:
+            while not self.queue.empty():
+                self.queue.get_nowait()
+            self.queue.put_nowait({"type": "resync"} if message is not None else None)
+            return False
+
+
+class EventHub:
+    """
+    Fans event change notifications out to SSE subscribers. Each subscriber
+    has a bounded queue, so a slow client never holds up writers or other
+    clients; when it overflows the client is told to resync (re-fetch).
+
+    With EVENT_STREAM_SOURCE=change_stream notifications come from a MongoDB
+    change stream on `events` (requires a replica set) instead of from the
+    write paths, and include writes made outside this API.
+    """
+
+    def __init__(self, backend: EventStreamBackend, max_subscribers: int, queue_size: int, source: str):
+        self.backend = backend
+        self.max_subscribers = max_subscribers
+        self.queue_size = queue_size
+        self.source = source
+        self._subscribers: Set[Subscription] = set()
+        self._watch_task: Optional[asyncio.Task] = None
+        self._sequence = 0
+        self.published = 0
+        self.delivered = 0
+        self.overflows = 0
+        self.rejected = 0
+        backend.attach(self._deliver)
+
+    async def start(self, db) -> None:
+        await self.backend.start()
+        if self.source == "change_stream" and self._watch_task is None:
+            self._watch_task = asyncio.create_task(self._watch(db), name="event-change-stream")
+
+    async def stop(self) -> None:
+        if self._watch_task:
+            self._watch_task.cancel()
+            try:
+                await self._watch_task
+            except asyncio.CancelledError:
+                pass
+            self._watch_task = None
+        await self.backend.stop()
+        # Ends every open stream so shutdown is not held up by connected clients
+        for subscription in list(self._subscribers):
+            subscription.offer(None)
+
+    def subscribe(self) -> Optional[Subscription]:
+        if len(self._subscribers) >= self.max_subscribers:
+            self.rejected += 1
+            return None
+        subscription = Subscription(self.queue_size)
+        self._subscribers.add(subscription)
+        return subscription
+
+    def unsubscribe(self, subscription: Subscription) -> None:
+        self._subscribers.discard(subscription)
+
+    async def publish(self, change: str, event_id, event: Optional[dict] = None) -> None:
+        """Announce a write from an API write path (ignored when a change stream is the source)"""
+        if self.source != "app":
+            return
+        await self._publish(change, event_id, event)
+
+    async def _publish(self, change: str, event_id, event: Optional[dict]) -> None:
+        message = {"type": change, "id": str(event_id)}
+        if event is not None:
+            message["event"] = {k: event[k] for k in STREAM_FIELDS if k in event}
+        self.published += 1
+        try:
+            await self.backend.publish(message)
+        except Exception:
+            # Notifications are best-effort; the write itself already succeeded
+            logging.exception("Could not publish event change %s", message["type"])
+
+    def _deliver(self, message: dict) -> None:
+        self._sequence += 1
+        message = {**message, "seq": self._sequence}
+        for subscription in self._subscribers:
+            if subscription.offer(message):
+                self.delivered += 1
+            else:
+                self.overflows += 1
+
+    async def _watch(self, db) -> None:
+        changes = {"insert": "created", "update": "updated", "replace": "updated", "delete": "deleted"}
+        while True:
+            try:
+                async with db.events.watch(full_document="updateLookup") as stream:
+                    async for change in stream:
+                        kind = changes.get(change["operationType"])
+                        if kind is None:
+                            continue
+                        event = change.get("fullDocument")
+                        # Report status transitions the way the API write paths do
+                        new_status = change.get("updateDescription", {}).get("updatedFields", {}).get("status")
+                        if new_status in ("approved", "archived"):
+                            kind = new_status
+                        await self._publish(kind, change["documentKey"]["_id"], event)
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                logging.exception("Event change stream failed; reconnecting")
+                await asyncio.sleep(5)
+
+    def format(self, message: dict) -> str:
+        """Render a message as an SSE frame"""
+        data = json.dumps(message, default=_json_default)
+        return f"id: {message.get('seq', '')}\nevent: {message['type']}\ndata: {data}\n\n"
+
+    def stats(self) -> dict:
+        return {
+            "source": self.source,
+            "subscribers": len(self._subscribers),
+            "max_subscribers": self.max_subscribers,
+            "published": self.published,
+            "delivered": self.delivered,
+            "overflows": self.overflows,
+            "rejected": self.rejected,
+        }
+
+
+event_hub = EventHub(
+    InMemoryEventStreamBackend(),
+    max_subscribers=int(os.getenv("EVENT_STREAM_MAX_SUBSCRIBERS", "1000")),
+    queue_size=int(os.getenv("EVENT_STREAM_QUEUE_SIZE", "100")),
+    source=os.getenv("EVENT_STREAM_SOURCE", "app").strip().lower(),
+)
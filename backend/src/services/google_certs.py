@@ -0,0 +1,75 @@
+import asyncio
+import logging
+import re
+import time
+from typing import Dict, Optional
+
+from services.http_client import request_with_retries
+
+GOOGLE_CERTS_URL = "https://www.googleapis.com/oauth2/v1/certs"
+
+# Refresh this many seconds before the advertised max-age runs out
+REFRESH_MARGIN_SECONDS = 300
+# Used when Google omits Cache-Control
+DEFAULT_MAX_AGE_SECONDS = 3600
+
+_MAX_AGE_RE = re.compile(r"max-age=(\d+)")
+
+
+class GoogleCertCache:
+    """
+    Google's ID-token signing certificates, cached for the Cache-Control
+    max-age of the certs response. Near expiry the current certs keep being
+    served while a background task fetches the new set.
+    """
+
+    def __init__(self, url: str = GOOGLE_CERTS_URL):
+        self.url = url
+        self._certs: Dict[str, str] = {}
+        self._expires_at = 0.0
+        self._lock = asyncio.Lock()
+        self._refresh_task: Optional[asyncio.Task] = None
+        self.fetches = 0
+        self.hits = 0
+
+    async def _fetch(self) -> None:
+        async with self._lock:
+            # Another caller may have refreshed while we waited for the lock
+            if self._certs and self._expires_at - time.time() > REFRESH_MARGIN_SECONDS:
+                return
+            response = await request_with_retries("GET", self.url)
+            response.raise_for_status()
+            match = _MAX_AGE_RE.search(response.headers.get("cache-control", ""))
+            max_age = int(match.group(1)) if match else DEFAULT_MAX_AGE_SECONDS
+            self._certs = response.json()
+            self._expires_at = time.time() + max_age
+            self.fetches += 1
+
+    async def _background_refresh(self) -> None:
+        try:
+            await self._fetch()
+        except Exception as e:
+            logging.warning("Background refresh of Google certs failed: %s", e)
+        finally:
+            self._refresh_task = None
+
+    async def get(self) -> Dict[str, str]:
+        remaining = self._expires_at - time.time()
+        if self._certs and remaining > 0:
+            self.hits += 1
+            if remaining < REFRESH_MARGIN_SECONDS and self._refresh_task is None:
+                self._refresh_task = asyncio.create_task(self._background_refresh())
+            return self._certs
+        await self._fetch()
+        return self._certs
+
+    def stats(self) -> dict:
+        return {
+            "keys": len(self._certs),
+            "expires_in": max(0, int(self._expires_at - time.time())),
+            "fetches": self.fetches,
+            "hits": self.hits,
+        }
+
+
+google_certs = GoogleCertCache()
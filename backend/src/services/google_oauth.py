@@ -1,9 +1,12 @@
 import os
 import json
-import requests
-from google.oauth2 import id_token
-from google.auth.transport import requests as google_requests
+import logging
+import httpx
+from google.auth import exceptions as google_exceptions
+from google.auth import jwt as google_jwt
 from dotenv import load_dotenv
+from services.http_client import request_with_retries
+from services.google_certs import google_certs
 
 load_dotenv()
 
@@ -41,7 +44,7 @@ class GoogleOAuthService:
         query_string = "&".join([f"{k}={v}" for k, v in params.items()])
         return f"{base_url}?{query_string}"
     
-    def exchange_code_for_token(self, code):
+    async def exchange_code_for_token(self, code):
         """Exchange authorization code for access token"""
         token_url = "https://oauth2.googleapis.com/token"
         
@@ -53,25 +56,33 @@ class GoogleOAuthService:
             "redirect_uri": self.redirect_uri
         }
         
-        response = requests.post(token_url, data=data)
+        # The code is single-use: resending after a read timeout would turn a
+        # slow success into invalid_grant
+        response = await request_with_retries("POST", token_url, idempotent=False, data=data)
         response.raise_for_status()
         return response.json()
     
-    def get_user_info(self, access_token):
+    async def get_user_info(self, access_token):
         """Get user information from Google"""
         userinfo_url = "https://www.googleapis.com/oauth2/v2/userinfo"
         headers = {"Authorization": f"Bearer {access_token}"}
         
-        response = requests.get(userinfo_url, headers=headers)
+        response = await request_with_retries("GET", userinfo_url, headers=headers)
         response.raise_for_status()
         return response.json()
     
-    def verify_id_token(self, id_token_str):
-        """Verify Google ID token"""
+    async def verify_id_token(self, id_token_str):
+        """Verify Google ID token locally against the cached signing certs"""
         try:
-            # Verify the token
-            idinfo = id_token.verify_oauth2_token(
-                id_token_str, google_requests.Request(), self.client_id
+            certs = await google_certs.get()
+        except httpx.HTTPError as e:
+            # Certs unavailable; callers fall back to the userinfo endpoint
+            logging.warning("Could not fetch Google certs: %s", e)
+            return None
+        try:
+            # Verify signature, audience and expiry
+            idinfo = google_jwt.decode(
+                id_token_str, certs=certs, audience=self.client_id, clock_skew_in_seconds=10
             )
             
             # Verify the issuer
@@ -79,5 +90,5 @@ class GoogleOAuthService:
                 raise ValueError('Wrong issuer.')
             
             return idinfo
-        except ValueError:
+        except (ValueError, google_exceptions.GoogleAuthError):
             return None
\ No newline at end of file
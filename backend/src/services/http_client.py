@@ -0,0 +1,120 @@
+import asyncio
+import logging
+import os
+import random
+import time
+from collections import defaultdict
+from typing import Optional
+from urllib.parse import urlsplit
+
+import httpx
+
+# Application-lifetime pooled client, opened/closed by the app lifespan
+_client: Optional[httpx.AsyncClient] = None
+
+# Per-host latency/outcome counters
+_stats = defaultdict(lambda: {"requests": 0, "errors": 0, "retries": 0, "total_ms": 0.0, "max_ms": 0.0})
+
+
+def _float_env(name: str, default: float) -> float:
+    try:
+        return float(os.getenv(name, str(default)))
+    except ValueError:
+        return default
+
+
+def init_http_client() -> httpx.AsyncClient:
+    """
+    Create the shared keep-alive HTTP client.
+
+    Env vars:
+      - HTTP_TIMEOUT_SECONDS: read/write/pool timeout (default 10)
+      - HTTP_CONNECT_TIMEOUT_SECONDS: connect timeout (default 5)
+      - HTTP_MAX_CONNECTIONS / HTTP_MAX_KEEPALIVE: pool limits (default 100 / 20)
+    """
+    global _client
+    if _client is None:
+        timeout = _float_env("HTTP_TIMEOUT_SECONDS", 10)
+        _client = httpx.AsyncClient(
+            timeout=httpx.Timeout(timeout, connect=_float_env("HTTP_CONNECT_TIMEOUT_SECONDS", 5)),
+            limits=httpx.Limits(
+                max_connections=int(_float_env("HTTP_MAX_CONNECTIONS", 100)),
+                max_keepalive_connections=int(_float_env("HTTP_MAX_KEEPALIVE", 20)),
+            ),
+        )
+    return _client
+
+
+async def close_http_client() -> None:
+    global _client
+    if _client is not None:
+        await _client.aclose()
+    _client = None
+
+
+def get_http_client() -> httpx.AsyncClient:
+    """Shared client; created on first use if the lifespan has not opened it"""
+    return _client or init_http_client()
+
+
+# Transport errors raised before the request reached the server, so retrying
+# cannot repeat a side effect
+_UNSENT_ERRORS = (httpx.ConnectError, httpx.ConnectTimeout, httpx.PoolTimeout)
+
+
+async def request_with_retries(method: str, url: str, idempotent: bool = True, **kwargs) -> httpx.Response:
+    """
+    Send a request on the shared client, retrying transport errors and 5xx
+    responses with exponential backoff and jitter.
+
+    With idempotent=False (e.g. redeeming a single-use code) only errors raised
+    before the request was sent are retried, not read timeouts or dropped
+    connections where the server may already have acted on it.
+
+    Env vars:
+      - HTTP_RETRIES: retries after the first attempt (default 2)
+      - HTTP_RETRY_BACKOFF_SECONDS: base backoff, doubled per retry (default 0.2)
+    """
+    retries = int(_float_env("HTTP_RETRIES", 2))
+    backoff = _float_env("HTTP_RETRY_BACKOFF_SECONDS", 0.2)
+    stats = _stats[urlsplit(url).netloc]
+    client = get_http_client()
+
+    for attempt in range(retries + 1):
+        started = time.perf_counter()
+        try:
+            response = await client.request(method, url, **kwargs)
+            error = None
+        except httpx.TransportError as e:
+            response, error = None, e
+        elapsed_ms = (time.perf_counter() - started) * 1000
+
+        stats["requests"] += 1
+        stats["total_ms"] += elapsed_ms
+        stats["max_ms"] = max(stats["max_ms"], elapsed_ms)
+
+        if error is not None and not idempotent and not isinstance(error, _UNSENT_ERRORS):
+            stats["errors"] += 1
+            raise error
+        retryable = error is not None or response.status_code >= 500
+        if not retryable:
+            return response
+        stats["errors"] += 1
+        if attempt == retries:
+            if error is not None:
+                raise error
+            return response
+
+        stats["retries"] += 1
+        delay = backoff * (2 ** attempt) * (0.5 + random.random())
+        logging.warning("%s %s failed (%s); retrying in %.2fs", method, url,
+                        error or response.status_code, delay)
+        await asyncio.sleep(delay)
+
+
+def http_stats() -> dict:
+    return {
+        host: {**s, "avg_ms": round(s["total_ms"] / s["requests"], 1) if s["requests"] else 0.0,
+               "total_ms": round(s["total_ms"], 1), "max_ms": round(s["max_ms"], 1)}
+        for host, s in _stats.items()
+    }
@@ -0,0 +1,90 @@
+import asyncio
+import os
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional
+from passlib.hash import bcrypt
+
+
+class HasherSaturatedError(Exception):
+    """Raised when too many bcrypt operations are already queued"""
+
+
+class PasswordHasher:
+    """
+    Runs bcrypt hashing/verification on a dedicated thread pool so the event
+    loop stays free (the bcrypt C extension releases the GIL while hashing).
+
+    Env vars:
+      - BCRYPT_ROUNDS: cost factor for new hashes (default 12)
+      - BCRYPT_WORKERS: concurrent bcrypt operations (default: CPU count)
+      - BCRYPT_MAX_PENDING: running + queued operations before new ones are
+        rejected with HasherSaturatedError (default 4 x workers)
+    """
+
+    def __init__(self, rounds: int, workers: int, max_pending: int):
+        self.rounds = rounds
+        self.workers = workers
+        self.max_pending = max_pending
+        self._hasher = bcrypt.using(rounds=rounds)
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self.pending = 0
+        self.completed = 0
+        self.rejected = 0
+        self.rehashed = 0
+
+    def _pool(self) -> ThreadPoolExecutor:
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="bcrypt")
+        return self._executor
+
+    async def _run(self, func, *args):
+        # Admission control: fail fast instead of letting the queue grow unbounded
+        if self.pending >= self.max_pending:
+            self.rejected += 1
+            raise HasherSaturatedError("Password hashing capacity exhausted")
+        self.pending += 1
+        try:
+            return await asyncio.get_running_loop().run_in_executor(self._pool(), func, *args)
+        finally:
+            self.pending -= 1
+            self.completed += 1
+
+    async def hash(self, password: str) -> str:
+        return await self._run(self._hasher.hash, password)
+
+    async def verify(self, password: str, hashed: str) -> bool:
+        return await self._run(bcrypt.verify, password, hashed)
+
+    def needs_rehash(self, hashed: str) -> bool:
+        """True if `hashed` was produced with a different cost than BCRYPT_ROUNDS"""
+        return self._hasher.needs_update(hashed)
+
+    async def rehash(self, password: str) -> str:
+        """Hash `password` at the current cost to replace an outdated hash"""
+        new_hash = await self.hash(password)
+        self.rehashed += 1
+        return new_hash
+
+    def shutdown(self) -> None:
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+    def stats(self) -> dict:
+        return {
+            "rounds": self.rounds,
+            "workers": self.workers,
+            "max_pending": self.max_pending,
+            "pending": self.pending,
+            "completed": self.completed,
+            "rejected": self.rejected,
+            "rehashed": self.rehashed,
+        }
+
+
+_workers = int(os.getenv("BCRYPT_WORKERS", str(os.cpu_count() or 1)))
+password_hasher = PasswordHasher(
+    rounds=int(os.getenv("BCRYPT_ROUNDS", "12")),
+    workers=_workers,
+    max_pending=int(os.getenv("BCRYPT_MAX_PENDING", str(_workers * 4))),
+)
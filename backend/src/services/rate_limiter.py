@@ -0,0 +1,112 @@
+import os
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from typing import Tuple
+
+
+class RateLimitExceeded(Exception):
+    def __init__(self, retry_after: float):
+        super().__init__(f"Rate limit exceeded; retry after {retry_after:.1f}s")
+        self.retry_after = retry_after
+
+
+class RateLimitBackend(ABC):
+    """
+    Token-bucket storage. The in-memory backend limits per worker; a shared
+    backend (e.g. Redis or Mongo) can implement `take` to limit across workers.
+    """
+
+    @abstractmethod
+    async def take(self, key: str, capacity: float, refill_per_second: float) -> float:
+        """Consume one token for `key`; return 0 if allowed, else seconds until a token is available"""
+
+
+class InMemoryRateLimitBackend(RateLimitBackend):
+    def __init__(self, max_keys: int = 100000):
+        self.max_keys = max_keys
+        # key -> (tokens, updated_at, full_at), least recently used first
+        self._buckets: "OrderedDict[str, Tuple[float, float, float]]" = OrderedDict()
+        self.evictions = 0
+
+    async def take(self, key: str, capacity: float, refill_per_second: float) -> float:
+        now = time.monotonic()
+        tokens, updated, _ = self._buckets.get(key, (capacity, now, now))
+        tokens = min(capacity, tokens + (now - updated) * refill_per_second)
+        if tokens < 1:
+            retry_after = (1 - tokens) / refill_per_second
+        else:
+            tokens -= 1
+            retry_after = 0.0
+        if key not in self._buckets and len(self._buckets) >= self.max_keys:
+            self._evict(now)
+        # Each bucket records when it is full again under its own limiter's
+        # refill rate; after that it carries no state and can be dropped
+        self._buckets[key] = (tokens, now, now + (capacity - tokens) / refill_per_second)
+        self._buckets.move_to_end(key)
+        return retry_after
+
+    def _evict(self, now: float) -> None:
+        # Drop refilled buckets from the cold end, then the least recently used
+        while self._buckets:
+            key, (_, _, full_at) = next(iter(self._buckets.items()))
+            if full_at > now:
+                break
+            del self._buckets[key]
+        if len(self._buckets) >= self.max_keys:
+            self._buckets.popitem(last=False)
+            self.evictions += 1
+
+    def stats(self) -> dict:
+        return {"keys": len(self._buckets), "max_keys": self.max_keys, "evictions": self.evictions}
+
+
+class TokenBucketLimiter:
+    """Allows `capacity` requests in a burst, refilled at capacity/period per second"""
+
+    def __init__(self, name: str, capacity: int, period_seconds: float, backend: RateLimitBackend):
+        self.name = name
+        self.capacity = capacity
+        self.refill_per_second = capacity / period_seconds
+        self.backend = backend
+        self.allowed = 0
+        self.rejected = 0
+
+    async def check(self, key: str) -> None:
+        retry_after = await self.backend.take(f"{self.name}:{key}", self.capacity, self.refill_per_second)
+        if retry_after > 0:
+            self.rejected += 1
+            raise RateLimitExceeded(retry_after)
+        self.allowed += 1
+
+    def stats(self) -> dict:
+        return {"allowed": self.allowed, "rejected": self.rejected}
+
+
+def _limit_env(name: str, default: str) -> Tuple[int, float]:
+    """Parse "<requests>/<seconds>" from the environment"""
+    value = os.getenv(name, default)
+    try:
+        count, period = value.split("/")
+        return int(count), float(period)
+    except ValueError:
+        count, period = default.split("/")
+        return int(count), float(period)
+
+
+backend: RateLimitBackend = InMemoryRateLimitBackend()
+
+login_ip_limiter = TokenBucketLimiter("login-ip", *_limit_env("RATE_LIMIT_LOGIN_PER_IP", "20/60"), backend)
+login_email_limiter = TokenBucketLimiter("login-email", *_limit_env("RATE_LIMIT_LOGIN_PER_EMAIL", "5/60"), backend)
+register_ip_limiter = TokenBucketLimiter("register-ip", *_limit_env("RATE_LIMIT_REGISTER_PER_IP", "5/300"), backend)
+register_email_limiter = TokenBucketLimiter("register-email", *_limit_env("RATE_LIMIT_REGISTER_PER_EMAIL", "3/300"), backend)
+
+
+def rate_limit_stats() -> dict:
+    stats = {
+        limiter.name: limiter.stats()
+        for limiter in (login_ip_limiter, login_email_limiter, register_ip_limiter, register_email_limiter)
+    }
+    if isinstance(backend, InMemoryRateLimitBackend):
+        stats["backend"] = backend.stats()
+    return stats
@@ -0,0 +1,53 @@
+import time
+from typing import Dict, Union
+from bson import ObjectId
+
+
+class TokenVersionRegistry:
+    """
+    In-memory map of user_id -> token_version for users whose tokens have been
+    revoked at least once (token_version > 0). Everyone else is implicitly at
+    version 0, so the map stays small and can be reloaded periodically.
+    """
+
+    def __init__(self):
+        self._versions: Dict[str, int] = {}
+        self.refreshed_at = 0.0
+        self.refreshes = 0
+        self.rejected = 0
+
+    async def refresh(self, db) -> None:
+        docs = await db.users.find(
+            {"token_version": {"$gt": 0}}, {"token_version": 1}
+        ).to_list(length=None)
+        loaded = {str(doc["_id"]): doc["token_version"] for doc in docs}
+        # Versions only grow; keep local bumps a concurrent refresh may not have seen yet
+        for user_id, version in self._versions.items():
+            if version > loaded.get(user_id, 0):
+                loaded[user_id] = version
+        self._versions = loaded
+        self.refreshed_at = time.time()
+        self.refreshes += 1
+
+    def current(self, user_id: str) -> int:
+        return self._versions.get(user_id, 0)
+
+    def is_current(self, user_id: str, token_version: int) -> bool:
+        if token_version >= self.current(user_id):
+            return True
+        self.rejected += 1
+        return False
+
+    def set(self, user_id: Union[str, ObjectId], token_version: int) -> None:
+        self._versions[str(user_id)] = token_version
+
+    def stats(self) -> dict:
+        return {
+            "tracked_users": len(self._versions),
+            "refreshes": self.refreshes,
+            "refreshed_at": self.refreshed_at,
+            "rejected": self.rejected,
+        }
+
+
+token_versions = TokenVersionRegistry()
@@ -0,0 +1,26 @@
+import os
+from typing import Optional, Union
+from bson import ObjectId
+from utils_dir.cache import TTLCache
+
+# Authenticated user documents keyed by str(user_id). Invalidation is local to
+# this process; other workers pick up changes once USER_CACHE_TTL_SECONDS expires.
+user_cache = TTLCache(
+    maxsize=int(os.getenv("USER_CACHE_MAX_SIZE", "10000")),
+    ttl=float(os.getenv("USER_CACHE_TTL_SECONDS", "60")),
+)
+
+
+def get_cached_user(user_id: str) -> Optional[dict]:
+    user = user_cache.get(user_id)
+    # Hand out copies so request handlers cannot mutate the cached document
+    return dict(user) if user is not None else None
+
+
+def cache_user(user: dict) -> None:
+    user_cache.set(str(user["_id"]), dict(user))
+
+
+def invalidate_user(user_id: Union[str, ObjectId]) -> None:
+    """Drop a user from the cache; call after any write to that user document"""
+    user_cache.invalidate(str(user_id))
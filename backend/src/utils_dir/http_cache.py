@@ -0,0 +1,64 @@
+import hashlib
+from datetime import datetime, timezone
+from email.utils import format_datetime, parsedate_to_datetime
+from typing import Any, Optional
+
+
+def _as_utc(value: Any) -> Optional[datetime]:
+    """updated_at may be stored as an ISO string or a (naive UTC) datetime"""
+    if isinstance(value, str):
+        try:
+            value = datetime.fromisoformat(value)
+        except ValueError:
+            return None
+    if not isinstance(value, datetime):
+        return None
+    return value.replace(tzinfo=timezone.utc) if value.tzinfo is None else value.astimezone(timezone.utc)
+
+
+def make_etag(*parts: Any) -> str:
+    """Strong ETag over the given version components"""
+    digest = hashlib.sha1("|".join(str(p) for p in parts).encode()).hexdigest()[:20]
+    return f'"{digest}"'
+
+
+def event_etag(event: dict) -> str:
+    return make_etag(event["_id"], event.get("updated_at"))
+
+
+def http_date(value: Any) -> Optional[str]:
+    moment = _as_utc(value)
+    return format_datetime(moment, usegmt=True) if moment else None
+
+
+def etag_matches(header: Optional[str], etag: str, strong: bool = False) -> bool:
+    """
+    True if an If-None-Match / If-Match header lists `etag` (or is *).
+    If-Match needs strong=True: a weak W/"..." validator never satisfies it.
+    """
+    if not header:
+        return False
+    candidates = [c.strip() for c in header.split(",")]
+    if "*" in candidates or etag in candidates:
+        return True
+    return not strong and f"W/{etag}" in candidates
+
+
+def is_not_modified(headers, etag: str, last_modified: Any = None) -> bool:
+    """
+    Evaluate conditional GET headers. If-None-Match takes precedence;
+    If-Modified-Since is only consulted when it is absent.
+    """
+    if_none_match = headers.get("if-none-match")
+    if if_none_match:
+        return etag_matches(if_none_match, etag)
+    if_modified_since = headers.get("if-modified-since")
+    modified = _as_utc(last_modified)
+    if not if_modified_since or modified is None:
+        return False
+    try:
+        since = parsedate_to_datetime(if_modified_since)
+    except (TypeError, ValueError):
+        return False
+    # HTTP dates have one-second resolution
+    return modified.replace(microsecond=0) <= since
@@ -0,0 +1,51 @@
+import base64
+import json
+from datetime import datetime
+from typing import Any, Tuple
+from bson import ObjectId
+from bson.errors import InvalidId
+
+
+class InvalidCursor(ValueError):
+    pass
+
+
+def _encode_value(value: Any) -> dict:
+    # Keep the BSON type so the keyset comparison matches what is stored
+    if isinstance(value, datetime):
+        return {"d": value.isoformat()}
+    return {"s": value}
+
+
+def _decode_value(encoded: dict) -> Any:
+    if "d" in encoded:
+        return datetime.fromisoformat(encoded["d"])
+    return encoded["s"]
+
+
+def encode_cursor(sort_value: Any, _id: ObjectId, direction: int) -> str:
+    """Opaque keyset cursor for the (sort_value, _id) position of the last item on a page"""
+    raw = json.dumps({"v": _encode_value(sort_value), "id": str(_id), "dir": direction}, separators=(",", ":"))
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str, direction: int) -> Tuple[Any, ObjectId]:
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        data = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        if data["dir"] != direction:
+            raise InvalidCursor("Cursor was issued for a different sort order")
+        return _decode_value(data["v"]), ObjectId(data["id"])
+    except (ValueError, KeyError, TypeError, InvalidId) as e:
+        if isinstance(e, InvalidCursor):
+            raise
+        raise InvalidCursor("Malformed cursor") from e
+
+
+def keyset_filter(field: str, value: Any, _id: ObjectId, direction: int) -> dict:
+    """Filter matching documents strictly after (value, _id) in the given sort direction"""
+    op = "$gt" if direction == 1 else "$lt"
+    return {"$or": [
+        {field: {op: value}},
+        {field: value, "_id": {op: _id}},
+    ]}
@@ -46,6 +46,13 @@ export interface AuthResponse {
   user: User;
 }
 
+export interface EventChange {
+  type: 'created' | 'updated' | 'approved' | 'archived' | 'deleted' | 'resync';
+  id?: string;
+  event?: Partial<Event>;
+  seq: number;
+}
+
 export interface ApiResponse<T> {
   data?: T;
   error?: string;
@@ -57,11 +64,11 @@ const getAuthToken = (): string | null => {
   return localStorage.getItem('auth_token');
 };
 
-// Helper function to make API requests
-const apiRequest = async <T>(
+// Helper function to make API requests; also returns the response headers
+const apiRequestWithHeaders = async <T>(
   endpoint: string,
   options: RequestInit = {}
-): Promise<ApiResponse<T>> => {
+): Promise<{ result: ApiResponse<T>; headers?: Headers }> => {
   const token = getAuthToken();
   
   const config: RequestInit = {
@@ -78,16 +85,24 @@ const apiRequest = async <T>(
     
     if (!response.ok) {
       const errorData = await response.json().catch(() => ({ message: 'Request failed' }));
-      return { error: errorData.message || `HTTP ${response.status}` };
+      return { result: { error: errorData.message || `HTTP ${response.status}` }, headers: response.headers };
     }
 
     const data = await response.json();
-    return { data };
+    return { result: { data }, headers: response.headers };
   } catch (error) {
-    return { error: error instanceof Error ? error.message : 'Network error' };
+    return { result: { error: error instanceof Error ? error.message : 'Network error' } };
   }
 };
 
+// Helper function to make API requests
+const apiRequest = async <T>(
+  endpoint: string,
+  options: RequestInit = {}
+): Promise<ApiResponse<T>> => {
+  return (await apiRequestWithHeaders<T>(endpoint, options)).result;
+};
+
 // Authentication API functions
 export const authApi = {
   // Google OAuth login
@@ -126,10 +141,23 @@ export const authApi = {
 
 // Events API functions
 export const eventsApi = {
-  // Get all events with optional status filter
+  // Get all events with optional status filter. The endpoint is paginated,
+  // so follow the X-Next-Cursor header until the last page.
   getAll: async (status?: string): Promise<ApiResponse<Event[]>> => {
-    const query = status ? `?status=${encodeURIComponent(status)}` : '';
-    return apiRequest<Event[]>(`/events${query}`);
+    const events: Event[] = [];
+    let cursor: string | null = null;
+    do {
+      const params = new URLSearchParams({ limit: '200' });
+      if (status) params.set('status', status);
+      if (cursor) params.set('cursor', cursor);
+      const { result, headers } = await apiRequestWithHeaders<Event[]>(`/events?${params.toString()}`);
+      if (result.error || !result.data) {
+        return result;
+      }
+      events.push(...result.data);
+      cursor = headers?.get('X-Next-Cursor') ?? null;
+    } while (cursor);
+    return { data: events };
   },
 
   // Get single event by ID
@@ -183,6 +211,53 @@ export const eventsApi = {
       method: 'DELETE',
     });
   },
+
+  // Subscribe to event change notifications. EventSource cannot send an
+  // Authorization header, so each connection uses a short-lived stream token
+  // in the URL; on error a fresh token is fetched and the stream reopened.
+  // Returns a function that closes the subscription.
+  subscribe: (onChange: (change: EventChange) => void): (() => void) => {
+    const types: EventChange['type'][] = ['created', 'updated', 'approved', 'archived', 'deleted', 'resync'];
+    let source: EventSource | null = null;
+    let retry: ReturnType<typeof setTimeout> | null = null;
+    let closed = false;
+
+    const connect = async () => {
+      const result = await apiRequest<{ token: string; expires_in: number }>('/events/stream/token', {
+        method: 'POST',
+      });
+      if (closed) return;
+      if (result.error || !result.data) {
+        retry = setTimeout(connect, 5000);
+        return;
+      }
+      source = new EventSource(
+        `${API_BASE_URL}/events/stream?token=${encodeURIComponent(result.data.token)}`
+      );
+      types.forEach((type) => {
+        source?.addEventListener(type, (message) => {
+          onChange(JSON.parse((message as MessageEvent).data) as EventChange);
+        });
+      });
+      source.onerror = () => {
+        // The browser would retry with the same, soon expired, token
+        source?.close();
+        source = null;
+        if (!closed) {
+          // Changes may have been missed while disconnected
+          onChange({ type: 'resync', seq: 0 });
+          retry = setTimeout(connect, 3000);
+        }
+      };
+    };
+
+    connect();
+    return () => {
+      closed = true;
+      if (retry) clearTimeout(retry);
+      source?.close();
+    };
+  },
 };
 
 // Files API functions